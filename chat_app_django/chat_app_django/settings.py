@@ -96,6 +96,12 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Reuse connections across requests instead of reconnecting per
+        # request; the health check revalidates a held connection before
+        # each request so stale ones are replaced transparently. Matters
+        # most on a networked database, harmless for sqlite.
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -136,6 +142,10 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "firebase_auth.authentication.FirebaseAuthentication",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "chat_app_django.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 # Static files (CSS, JavaScript, Images)
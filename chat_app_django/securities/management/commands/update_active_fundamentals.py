@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, reset_queries, transaction
 from django.db.models import Q
 from securities.models import Security, SecurityFundamentals, WatchlistItem, Holding
 from securities.services.fmp_service import get_fmp_service
@@ -49,6 +49,11 @@ class Command(BaseCommand):
         if verbose:
             logging.getLogger(__name__).setLevel(logging.DEBUG)
 
+        # Long runs execute thousands of queries; make sure Django's debug
+        # query log stays off so memory doesn't grow with every statement
+        connection.force_debug_cursor = False
+        reset_queries()
+
         # Calculate sleep time between requests (in seconds)
         sleep_time = 60.0 / rate_limit if rate_limit > 0 else 0.24
 
@@ -111,6 +116,9 @@ class Command(BaseCommand):
             total_created += batch_results["created"]
             total_errors += batch_results["errors"]
 
+            # Drop any accumulated query log between batches
+            reset_queries()
+
             # Progress update
             progress = min(i + batch_size, total_securities)
             elapsed_time = time.time() - start_time
@@ -282,10 +290,13 @@ class Command(BaseCommand):
                 )
                 
                 if not created:
-                    # Update existing record
+                    # Update existing record, touching only the fetched columns
+                    # (plus last_updated, which auto_now only refreshes when listed)
                     for field, value in fundamentals_data.items():
                         setattr(fundamentals, field, value)
-                    fundamentals.save()
+                    fundamentals.save(
+                        update_fields=[*fundamentals_data, "last_updated"]
+                    )
 
                 if verbose:
                     logger.info(
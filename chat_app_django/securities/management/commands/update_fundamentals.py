@@ -1,10 +1,11 @@
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, reset_queries, transaction
 from django.utils import timezone
 from securities.models import Security, SecurityFundamentals
 from securities.services.fmp_service import get_fmp_service
 import logging
 import time
+from itertools import islice
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -57,6 +58,11 @@ class Command(BaseCommand):
         specific_symbols = options["symbols"]
         resume = options["resume"]
 
+        # Long runs execute thousands of queries; make sure Django's debug
+        # query log stays off so memory doesn't grow with every statement
+        connection.force_debug_cursor = False
+        reset_queries()
+
         # Calculate sleep time between requests (in seconds)
         sleep_time = 60.0 / rate_limit if rate_limit > 0 else 0.3
 
@@ -94,8 +100,8 @@ class Command(BaseCommand):
                 fundamentals__last_updated__gte=cutoff_time
             )
 
-        securities = list(securities_queryset.order_by('symbol'))
-        total_securities = len(securities)
+        securities_queryset = securities_queryset.order_by('symbol')
+        total_securities = securities_queryset.count()
 
         if total_securities == 0:
             self.stdout.write(
@@ -117,8 +123,13 @@ class Command(BaseCommand):
 
         start_time = time.time()
 
+        # Stream rows in chunks instead of materializing the full catalog;
+        # peak memory stays O(batch_size) however many securities exist
+        rows = securities_queryset.iterator(chunk_size=batch_size)
         for i in range(0, total_securities, batch_size):
-            batch = securities[i : i + batch_size]
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
             batch_results = self._process_batch(
                 batch, fmp_service, sleep_time, dry_run
             )
@@ -128,6 +139,9 @@ class Command(BaseCommand):
             total_created += batch_results["created"]
             total_errors += batch_results["errors"]
 
+            # Drop any accumulated query log between batches
+            reset_queries()
+
             # Progress update
             progress = min(i + batch_size, total_securities)
             elapsed_time = time.time() - start_time
@@ -162,11 +176,33 @@ class Command(BaseCommand):
                 )
             )
 
+    # Columns written by the per-batch upsert (everything in _build_fundamentals
+    # plus the auto_now freshness stamp carried over from the inserted row).
+    UPSERT_FIELDS = [
+        "current_price",
+        "previous_close",
+        "day_change",
+        "market_cap",
+        "volume",
+        "avg_volume",
+        "day_high",
+        "day_low",
+        "open_price",
+        "year_high",
+        "year_low",
+        "price_avg_50",
+        "price_avg_200",
+        "exchange_name",
+        "data_timestamp",
+        "last_updated",
+    ]
+
     def _process_batch(
         self, batch: List[Security], fmp_service, sleep_time: float, dry_run: bool
     ) -> Dict[str, int]:
         """Process a batch of securities."""
         results = {"processed": 0, "updated": 0, "created": 0, "errors": 0}
+        pending: List[SecurityFundamentals] = []
 
         for security in batch:
             results["processed"] += 1
@@ -175,7 +211,7 @@ class Command(BaseCommand):
             try:
                 # Fetch quote data from FMP
                 quote_data = fmp_service.get_quote(symbol)
-                
+
                 if not quote_data:
                     self.stdout.write(
                         self.style.WARNING(f"No quote data returned for {symbol}")
@@ -191,12 +227,8 @@ class Command(BaseCommand):
                     )
                     results["updated"] += 1
                 else:
-                    # Update or create SecurityFundamentals record
-                    is_created = self._update_security_fundamentals(security, quote_data)
-                    if is_created:
-                        results["created"] += 1
-                    else:
-                        results["updated"] += 1
+                    # Collect rows and flush once per batch with a single upsert
+                    pending.append(self._build_fundamentals(security, quote_data))
 
                 # Respect rate limit
                 time.sleep(sleep_time)
@@ -209,13 +241,76 @@ class Command(BaseCommand):
                 logger.error(f"Error processing {symbol}: {str(e)}")
                 time.sleep(sleep_time)  # Still respect rate limit on errors
 
+        if pending:
+            try:
+                created, updated = self._flush_fundamentals(pending)
+                results["created"] += created
+                results["updated"] += updated
+            except Exception as e:
+                # One bad batch shouldn't abort the whole long-running
+                # command; count its rows as errors and keep going
+                self.stdout.write(
+                    self.style.ERROR(f"Error saving batch: {str(e)}")
+                )
+                results["errors"] += len(pending)
+
         return results
 
-    def _update_security_fundamentals(
+    def _flush_fundamentals(
+        self, pending: List[SecurityFundamentals]
+    ) -> "tuple[int, int]":
+        """
+        Upsert a batch of SecurityFundamentals in one INSERT ... ON CONFLICT
+        DO UPDATE statement. Returns (created_count, updated_count).
+        """
+        try:
+            # Figure out which rows already exist so the summary stats stay accurate
+            existing_ids = set(
+                SecurityFundamentals.objects.filter(
+                    security_id__in=[f.security_id for f in pending]
+                ).values_list("security_id", flat=True)
+            )
+
+            # Group rows by which fields the quote actually carried and
+            # restrict each upsert's update set to those fields, so a
+            # partial quote never overwrites stored data with None
+            # (matching the old per-row update path and the sibling
+            # update_active_fundamentals command)
+            groups: Dict[tuple, List[SecurityFundamentals]] = {}
+            for row in pending:
+                present = tuple(
+                    field for field in self.UPSERT_FIELDS
+                    if field == "last_updated"
+                    or getattr(row, field, None) is not None
+                )
+                groups.setdefault(present, []).append(row)
+
+            with transaction.atomic():
+                for update_fields, rows in groups.items():
+                    SecurityFundamentals.objects.bulk_create(
+                        rows,
+                        update_conflicts=True,
+                        unique_fields=["security"],
+                        update_fields=list(update_fields),
+                        batch_size=500,
+                    )
+
+            created = sum(1 for f in pending if f.security_id not in existing_ids)
+            logger.info(
+                f"Upserted fundamentals for {len(pending)} securities "
+                f"({created} created, {len(pending) - created} updated)"
+            )
+            return created, len(pending) - created
+
+        except Exception as e:
+            logger.error(f"Error bulk-saving fundamentals batch: {str(e)}")
+            raise
+
+    def _build_fundamentals(
         self, security: Security, quote_data: Dict[str, Any]
-    ) -> bool:
-        """Update or create SecurityFundamentals record. Returns True if created, False if updated."""
-        
+    ) -> SecurityFundamentals:
+        """Build an unsaved SecurityFundamentals instance from FMP quote data."""
+
         # Convert values to Decimal where needed, handling None values
         def to_decimal(value):
             if value is None or value == '':
@@ -233,48 +328,22 @@ class Command(BaseCommand):
             except (ValueError, TypeError):
                 return None
 
-        # Prepare the data for SecurityFundamentals
-        # Note: day_change_percent is now calculated automatically by the model property
-        fundamentals_data = {
-            'current_price': to_decimal(quote_data.get('price')),
-            'previous_close': to_decimal(quote_data.get('previousClose')),
-            'day_change': to_decimal(quote_data.get('change')),
-            'market_cap': to_int(quote_data.get('marketCap')),
-            'volume': to_int(quote_data.get('volume')),
-            'avg_volume': to_int(quote_data.get('avgVolume')),
-            'day_high': to_decimal(quote_data.get('dayHigh')),
-            'day_low': to_decimal(quote_data.get('dayLow')),
-            'open_price': to_decimal(quote_data.get('open')),
-            'year_high': to_decimal(quote_data.get('yearHigh')),
-            'year_low': to_decimal(quote_data.get('yearLow')),
-            'price_avg_50': to_decimal(quote_data.get('priceAvg50')),
-            'price_avg_200': to_decimal(quote_data.get('priceAvg200')),
-            'exchange_name': quote_data.get('exchange', '')[:50],  # Ensure field length limit
-            'data_timestamp': to_int(quote_data.get('timestamp')),
-        }
-
-        # Remove None values to avoid overwriting existing data with None
-        fundamentals_data = {k: v for k, v in fundamentals_data.items() if v is not None}
-
-        try:
-            with transaction.atomic():
-                fundamentals, created = SecurityFundamentals.objects.get_or_create(
-                    security=security,
-                    defaults=fundamentals_data
-                )
-                
-                if not created:
-                    # Update existing record
-                    for field, value in fundamentals_data.items():
-                        setattr(fundamentals, field, value)
-                    fundamentals.save()
-
-                logger.info(
-                    f"{'Created' if created else 'Updated'} fundamentals for {security.symbol}"
-                )
-                
-                return created
-
-        except Exception as e:
-            logger.error(f"Error saving fundamentals for {security.symbol}: {str(e)}")
-            raise
\ No newline at end of file
+        # Note: day_change_percent is calculated automatically by the model property
+        return SecurityFundamentals(
+            security=security,
+            current_price=to_decimal(quote_data.get('price')),
+            previous_close=to_decimal(quote_data.get('previousClose')),
+            day_change=to_decimal(quote_data.get('change')),
+            market_cap=to_int(quote_data.get('marketCap')),
+            volume=to_int(quote_data.get('volume')),
+            avg_volume=to_int(quote_data.get('avgVolume')),
+            day_high=to_decimal(quote_data.get('dayHigh')),
+            day_low=to_decimal(quote_data.get('dayLow')),
+            open_price=to_decimal(quote_data.get('open')),
+            year_high=to_decimal(quote_data.get('yearHigh')),
+            year_low=to_decimal(quote_data.get('yearLow')),
+            price_avg_50=to_decimal(quote_data.get('priceAvg50')),
+            price_avg_200=to_decimal(quote_data.get('priceAvg200')),
+            exchange_name=quote_data.get('exchange', '')[:50],  # Ensure field length limit
+            data_timestamp=to_int(quote_data.get('timestamp')),
+        )
\ No newline at end of file
@@ -1,18 +1,159 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from securities.models import Security
+from django.db.models import Case, Count, F, Q, URLField, Value, When
+from django.utils import timezone
+from securities.models import Security, SecurityLogo
 from securities.services.fmp_service import get_fmp_service
+from securities.signals import bump_securities_version
+import asyncio
+import itertools
+import json
 import logging
+import os
+import random
+import sqlite3
+import tempfile
 import time
-from typing import List, Dict, Any
-from urllib.parse import urlparse
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    Asyncio token bucket used to pace FMP API calls.
+    Capacity and refill rate are both derived from the per-minute quota, so
+    concurrent requests can burst up to the quota but never exceed it.
+    """
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(max(rate_per_minute, 1))
+        self.tokens = self.capacity
+        self.refill_rate = self.capacity / 60.0  # tokens per second
+        self.last_refill = time.monotonic()
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until enough tokens are available, then consume them.
+
+        The balance is debited before sleeping, so concurrent callers queue
+        up behind each other without needing a lock around the await.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_refill) * self.refill_rate,
+        )
+        self.last_refill = now
+        self.tokens -= tokens
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.refill_rate)
+
+    def load(self, path: str):
+        """Resume from a snapshot persisted by a previous run.
+
+        The balance is refilled for the wall-clock time elapsed since the
+        snapshot, so back-to-back runs keep honouring the quota instead of
+        bursting a fresh full bucket, while runs after a long gap start at
+        full capacity as before.
+        """
+        try:
+            with open(path) as f:
+                state = json.load(f)
+            elapsed = max(0.0, time.time() - float(state["saved_at"]))
+            self.tokens = min(
+                self.capacity,
+                float(state["tokens"]) + elapsed * self.refill_rate,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # no snapshot (or a corrupt one): keep the full bucket
+
+    def save(self, path: str):
+        """Persist the current balance for the next run to resume from."""
+        try:
+            with open(path, "w") as f:
+                json.dump({"tokens": self.tokens, "saved_at": time.time()}, f)
+        except OSError as e:
+            logger.warning(f"Could not persist rate limiter state: {e}")
+
+
+class LogoCache:
+    """
+    On-disk cache of previously fetched logo URLs, keyed by symbol.
+    Lets reruns skip FMP entirely for symbols fetched recently whose logo
+    already matches what is stored in the database.
+    """
+
+    TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS logo_cache "
+            "(symbol TEXT PRIMARY KEY, url TEXT, etag TEXT, fetched REAL)"
+        )
+        self._conn.commit()
+
+    def get_fresh(self, symbols: List[str]) -> Dict[str, str]:
+        """Return {symbol: url} for cached entries still within the TTL."""
+        if not symbols:
+            return {}
+        cutoff = time.time() - self.TTL_SECONDS
+        placeholders = ",".join("?" * len(symbols))
+        rows = self._conn.execute(
+            f"SELECT symbol, url FROM logo_cache "
+            f"WHERE symbol IN ({placeholders}) AND fetched > ?",
+            [*symbols, cutoff],
+        )
+        return dict(rows.fetchall())
+
+    def get_known(self, symbols: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Return {symbol: (url, etag)} for all cached entries, TTL or not."""
+        if not symbols:
+            return {}
+        placeholders = ",".join("?" * len(symbols))
+        rows = self._conn.execute(
+            f"SELECT symbol, url, etag FROM logo_cache "
+            f"WHERE symbol IN ({placeholders})",
+            symbols,
+        )
+        return {symbol: (url, etag or "") for symbol, url, etag in rows.fetchall()}
+
+    def put_many(self, entries: Iterable[Tuple[str, str, str]]):
+        """Record freshly fetched (symbol, url, etag) entries."""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO logo_cache (symbol, url, etag, fetched) "
+            "VALUES (?, ?, ?, ?)",
+            [(symbol, url, etag, now) for symbol, url, etag in entries],
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
 class Command(BaseCommand):
     help = "Update Security logo URLs using Financial Modeling Prep company profile data"
 
+    # Upper bound on in-flight HTTP requests, independent of the rate limit
+    MAX_CONCURRENT_REQUESTS = 64
+
+    # Retries for rate-limited responses before giving up on a symbol
+    MAX_FETCH_ATTEMPTS = 3
+
+    # FMP's profile endpoint accepts a comma-separated symbol list, so one
+    # API call (and one rate-limit token) covers this many securities
+    PROFILE_SYMBOLS_PER_CALL = 50
+
+    # FMP's logo CDN; HEAD requests here are cheap and don't count against
+    # the API quota, so an unchanged ETag can skip the profile call entirely
+    LOGO_CDN_URL = "https://financialmodelingprep.com/image-stock/{symbol}.png"
+
+    # Set in handle() when the on-disk cache is enabled
+    logo_cache: Optional[LogoCache] = None
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--rate-limit",
@@ -41,6 +182,21 @@ class Command(BaseCommand):
             action="store_true",
             help="Update only securities that don't currently have logo URLs",
         )
+        parser.add_argument(
+            "--cache-file",
+            default=os.path.join(tempfile.gettempdir(), "fmp_logo_cache.sqlite"),
+            help="Path to the on-disk logo cache used to skip recently fetched symbols",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Ignore the on-disk logo cache and always hit the FMP API",
+        )
+        parser.add_argument(
+            "--bucket-state-file",
+            default=os.path.join(tempfile.gettempdir(), "fmp_logo_bucket.json"),
+            help="Path where the rate limiter persists its balance between runs",
+        )
 
     def handle(self, *args, **options):
         rate_limit = options["rate_limit"]
@@ -49,13 +205,14 @@ class Command(BaseCommand):
         specific_symbols = options["symbols"]
         missing_only = options["missing_only"]
 
-        # Calculate sleep time between requests (in seconds)
-        sleep_time = 60.0 / rate_limit if rate_limit > 0 else 0.3
+        # Styled prefix computed once; per-symbol error lines just prepend it
+        # instead of paying an ANSI-wrapping style call per message
+        self._err_prefix = self.style.ERROR("ERROR ")
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"Starting logo URL update - Rate limit: {rate_limit}/min "
-                f"(~{sleep_time:.2f}s between calls)"
+                f"(up to {self.MAX_CONCURRENT_REQUESTS} concurrent requests)"
             )
         )
 
@@ -79,13 +236,21 @@ class Command(BaseCommand):
             )
             self.stdout.write(f"Processing specific symbols: {', '.join(specific_symbols)}")
         elif missing_only:
-            securities_queryset = securities_queryset.filter(logo_url__in=['', None])
+            # Same predicate as the sec_missing_logo_idx partial index;
+            # an IN ('', NULL) filter never matches NULL rows
+            securities_queryset = securities_queryset.filter(
+                Q(logo_url='') | Q(logo_url__isnull=True)
+            )
             self.stdout.write("Processing only securities without logo URLs")
         else:
             self.stdout.write("Processing ALL securities (will replace existing logos)")
 
-        securities = list(securities_queryset.order_by('symbol'))
-        total_securities = len(securities)
+        # Stream plain tuples instead of hydrating model instances; the
+        # update path only needs the pk, the symbol and the current logo
+        securities_queryset = securities_queryset.order_by('symbol').values_list(
+            'id', 'symbol', 'logo_url'
+        )
+        total_securities = securities_queryset.count()
 
         if total_securities == 0:
             self.stdout.write(
@@ -95,44 +260,48 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Found {total_securities} securities to update")
 
-        # Calculate estimated time
-        estimated_minutes = (total_securities * sleep_time) / 60
+        # Calculate estimated time (fetches are quota-bound, not latency-bound)
+        estimated_minutes = total_securities / rate_limit if rate_limit > 0 else 0
         self.stdout.write(f"Estimated completion time: {estimated_minutes:.1f} minutes")
 
-        # Current logo status
-        current_with_logos = Security.objects.exclude(logo_url__in=['', None]).count()
-        self.stdout.write(f"Current securities with logos: {current_with_logos}")
+        # Current logo status: count the missing side (which matches the
+        # sec_missing_logo_idx partial index) and derive the rest
+        stats = Security.objects.aggregate(
+            total=Count('id'),
+            missing_logos=Count(
+                'id', filter=Q(logo_url='') | Q(logo_url__isnull=True)
+            ),
+        )
+        stats['with_logos'] = stats['total'] - stats['missing_logos']
+        self.stdout.write(f"Current securities with logos: {stats['with_logos']}")
 
-        # Process in batches
-        total_processed = 0
-        total_updated = 0
-        total_skipped = 0
-        total_errors = 0
+        # On-disk cache lets reruns skip symbols fetched recently
+        if not options["no_cache"]:
+            try:
+                self.logo_cache = LogoCache(options["cache_file"])
+            except sqlite3.Error as e:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Logo cache unavailable ({e}) - continuing without it"
+                    )
+                )
+                self.logo_cache = None
 
         start_time = time.time()
 
-        for i in range(0, total_securities, batch_size):
-            batch = securities[i : i + batch_size]
-            batch_results = self._process_batch(
-                batch, fmp_service, sleep_time, dry_run
+        try:
+            totals = self._process_all(
+                securities_queryset, fmp_service, rate_limit, batch_size, dry_run,
+                total_securities, options["bucket_state_file"],
             )
+        finally:
+            if self.logo_cache:
+                self.logo_cache.close()
 
-            total_processed += batch_results["processed"]
-            total_updated += batch_results["updated"]
-            total_skipped += batch_results["skipped"]
-            total_errors += batch_results["errors"]
-
-            # Progress update
-            progress = min(i + batch_size, total_securities)
-            elapsed_time = time.time() - start_time
-            
-            self.stdout.write(
-                f"Progress: {progress}/{total_securities} "
-                f"(Updated: {batch_results['updated']}, "
-                f"Skipped: {batch_results['skipped']}, "
-                f"Errors: {batch_results['errors']}, "
-                f"Elapsed: {elapsed_time/60:.1f}min)"
-            )
+        total_processed = totals["processed"]
+        total_updated = totals["updated"]
+        total_skipped = totals["skipped"]
+        total_errors = totals["errors"]
 
         # Final summary
         elapsed_time = time.time() - start_time
@@ -146,10 +315,13 @@ class Command(BaseCommand):
         self.stdout.write(f"Average rate: {total_processed/(elapsed_time/60):.1f} securities/minute")
 
         if not dry_run:
-            # Final logo count
-            final_with_logos = Security.objects.exclude(logo_url__in=['', None]).count()
+            # Final logo count: again count the indexed missing side and
+            # derive coverage from the unchanged table total
+            final_with_logos = stats['total'] - Security.objects.filter(
+                Q(logo_url='') | Q(logo_url__isnull=True)
+            ).count()
             self.stdout.write(f"\nFinal securities with logos: {final_with_logos}")
-            self.stdout.write(f"Logo coverage: {(final_with_logos/Security.objects.count())*100:.1f}%")
+            self.stdout.write(f"Logo coverage: {(final_with_logos/stats['total'])*100:.1f}%")
 
         if dry_run:
             self.stdout.write(
@@ -162,88 +334,352 @@ class Command(BaseCommand):
                 )
             )
 
-    def _process_batch(
-        self, batch: List[Security], fmp_service, sleep_time: float, dry_run: bool
+    def _process_all(
+        self,
+        securities_queryset,
+        fmp_service,
+        rate_limit: int,
+        batch_size: int,
+        dry_run: bool,
+        total_securities: int,
+        bucket_state_file: str,
+    ) -> Dict[str, int]:
+        """
+        Drive the batched fetch/update loop. Fetches run concurrently on a
+        single event loop; database writes happen synchronously between
+        batches (Django's ORM cannot be called from a running loop).
+        """
+        totals = {"processed": 0, "updated": 0, "skipped": 0, "errors": 0}
+
+        limiter = TokenBucket(rate_limit)
+        limiter.load(bucket_state_file)
+        start_time = time.time()
+
+        loop = asyncio.new_event_loop()
+        # HTTP/2 multiplexes the concurrent profile requests over a couple of
+        # TLS connections instead of paying handshake + ramp-up per socket
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=32,
+            ),
+        )
+        try:
+            # Server-side cursor keeps only one batch of rows in memory
+            rows = securities_queryset.iterator(chunk_size=batch_size)
+            while batch := list(itertools.islice(rows, batch_size)):
+                # Cache hits (recently fetched, DB already matches) skip FMP
+                cache_skipped = 0
+                if self.logo_cache:
+                    fresh = self.logo_cache.get_fresh(
+                        [symbol for _, symbol, _ in batch]
+                    )
+                    to_fetch = []
+                    for row in batch:
+                        _, symbol, current_logo_url = row
+                        if current_logo_url and fresh.get(symbol) == current_logo_url:
+                            cache_skipped += 1
+                        else:
+                            to_fetch.append(row)
+                    batch = to_fetch
+
+                # Cheap CDN HEADs: an unchanged logo ETag means the profile
+                # call would be wasted quota, so those symbols skip it too
+                etags: Dict[str, str] = {}
+                if self.logo_cache and batch and not dry_run:
+                    etags = loop.run_until_complete(
+                        self._check_logo_etags(
+                            [symbol for _, symbol, _ in batch], client
+                        )
+                    )
+                    known = self.logo_cache.get_known(
+                        [symbol for _, symbol, _ in batch]
+                    )
+                    to_fetch = []
+                    refreshed = []
+                    for row in batch:
+                        _, symbol, current_logo_url = row
+                        cached_url, cached_etag = known.get(symbol, ("", ""))
+                        etag = etags.get(symbol, "")
+                        if (
+                            current_logo_url
+                            and etag
+                            and cached_etag == etag
+                            and cached_url == current_logo_url
+                        ):
+                            cache_skipped += 1
+                            refreshed.append((symbol, cached_url, cached_etag))
+                        else:
+                            to_fetch.append(row)
+                    if refreshed:
+                        self.logo_cache.put_many(refreshed)
+                    batch = to_fetch
+
+                profiles = (
+                    loop.run_until_complete(
+                        self._fetch_batch(batch, client, fmp_service, limiter)
+                    )
+                    if batch
+                    else {}
+                )
+                batch_results = self._apply_batch(batch, profiles, dry_run, etags)
+                batch_results["processed"] += cache_skipped
+                batch_results["skipped"] += cache_skipped
+
+                totals["processed"] += batch_results["processed"]
+                totals["updated"] += batch_results["updated"]
+                totals["skipped"] += batch_results["skipped"]
+                totals["errors"] += batch_results["errors"]
+
+                # Progress update
+                progress = min(totals["processed"], total_securities)
+                elapsed_time = time.time() - start_time
+
+                self.stdout.write(
+                    f"Progress: {progress}/{total_securities} "
+                    f"(Updated: {batch_results['updated']}, "
+                    f"Skipped: {batch_results['skipped']}, "
+                    f"Errors: {batch_results['errors']}, "
+                    f"Elapsed: {elapsed_time/60:.1f}min)"
+                )
+        finally:
+            limiter.save(bucket_state_file)
+            loop.run_until_complete(client.aclose())
+            loop.close()
+
+        return totals
+
+    async def _fetch_batch(
+        self,
+        batch: List[Tuple[int, str, str]],
+        client: httpx.AsyncClient,
+        fmp_service,
+        limiter: TokenBucket,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch profiles for a batch of securities, many symbols per call."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        symbols = [symbol for _, symbol, _ in batch]
+        chunks = [
+            symbols[i : i + self.PROFILE_SYMBOLS_PER_CALL]
+            for i in range(0, len(symbols), self.PROFILE_SYMBOLS_PER_CALL)
+        ]
+        chunk_results = await asyncio.gather(
+            *(
+                self._fetch_profiles(chunk, client, fmp_service, limiter, semaphore)
+                for chunk in chunks
+            )
+        )
+
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for chunk_profiles in chunk_results:
+            profiles.update(chunk_profiles)
+        return profiles
+
+    async def _check_logo_etags(
+        self, symbols: List[str], client: httpx.AsyncClient
+    ) -> Dict[str, str]:
+        """HEAD the logo CDN for each symbol and collect ETags (no quota cost)."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def head_one(symbol: str) -> Tuple[str, str]:
+            async with semaphore:
+                try:
+                    response = await client.head(
+                        self.LOGO_CDN_URL.format(symbol=symbol)
+                    )
+                    if response.status_code == 200:
+                        return symbol, response.headers.get("etag", "")
+                except httpx.HTTPError:
+                    pass
+                return symbol, ""
+
+        results = await asyncio.gather(*(head_one(symbol) for symbol in symbols))
+        return {symbol: etag for symbol, etag in results if etag}
+
+    def _apply_batch(
+        self,
+        batch: List[Tuple[int, str, str]],
+        profiles: Dict[str, Dict[str, Any]],
+        dry_run: bool,
+        etags: Optional[Dict[str, str]] = None,
     ) -> Dict[str, int]:
-        """Process a batch of securities."""
+        """Apply fetched profile data to a batch of securities."""
         results = {"processed": 0, "updated": 0, "skipped": 0, "errors": 0}
+        updates: List[Tuple[int, str, str]] = []  # (pk, symbol, new logo URL)
+        fetched: List[Tuple[str, str, str]] = []  # (symbol, url, etag) for the cache
+        etags = etags or {}
 
-        for security in batch:
+        for pk, symbol, current_logo_url in batch:
             results["processed"] += 1
-            symbol = security.symbol
+            profile_data = profiles.get(symbol)
 
             try:
-                # Fetch company profile data from FMP
-                profile_data = fmp_service.get_ticker_details(symbol)
-                
                 if not profile_data:
-                    self.stdout.write(
-                        self.style.WARNING(f"No profile data returned for {symbol}")
-                    )
+                    # Per-symbol diagnostics go to the (buffered) logger;
+                    # stdout is reserved for the per-batch progress line
+                    logger.warning(f"No profile data returned for {symbol}")
                     results["errors"] += 1
-                    time.sleep(sleep_time)  # Still respect rate limit on errors
                     continue
 
                 # Extract logo URL from profile data
                 new_logo_url = profile_data.get('image', '').strip()
-                
+
                 if not new_logo_url:
-                    self.stdout.write(
-                        self.style.WARNING(f"No logo URL found in profile for {symbol}")
-                    )
+                    logger.warning(f"No logo URL found in profile for {symbol}")
                     results["skipped"] += 1
-                    time.sleep(sleep_time)
                     continue
 
                 # Validate URL format
                 if not self._is_valid_url(new_logo_url):
-                    self.stdout.write(
-                        self.style.WARNING(f"Invalid logo URL format for {symbol}: {new_logo_url}")
+                    logger.warning(
+                        f"Invalid logo URL format for {symbol}: {new_logo_url}"
                     )
                     results["skipped"] += 1
-                    time.sleep(sleep_time)
                     continue
 
-                # Check if logo URL is different (to avoid unnecessary updates)
-                if security.logo_url == new_logo_url:
-                    results["skipped"] += 1
-                    time.sleep(sleep_time)
-                    continue
+                fetched.append((symbol, new_logo_url, etags.get(symbol, "")))
 
                 if dry_run:
-                    old_logo = security.logo_url or "(empty)"
+                    if current_logo_url == new_logo_url:
+                        results["skipped"] += 1
+                        continue
+                    old_logo = current_logo_url or "(empty)"
                     self.stdout.write(
                         f"Would update {symbol}: {old_logo} -> {new_logo_url}"
                     )
                     results["updated"] += 1
                 else:
-                    # Update the security logo URL
-                    old_logo_url = security.logo_url
-                    security.logo_url = new_logo_url
-                    security.save(update_fields=['logo_url'])
-                    
-                    results["updated"] += 1
-                    logger.info(
-                        f"Updated logo for {symbol}: {old_logo_url or '(empty)'} -> {new_logo_url}"
-                    )
-
-                # Respect rate limit
-                time.sleep(sleep_time)
+                    # Stage unconditionally; the UPDATE itself filters out
+                    # rows whose logo already matches
+                    updates.append((pk, symbol, new_logo_url))
 
             except Exception as e:
                 self.stdout.write(
-                    self.style.ERROR(f"Error processing {symbol}: {str(e)}")
+                    f"{self._err_prefix}processing {symbol}: {str(e)}"
                 )
                 results["errors"] += 1
                 logger.error(f"Error processing {symbol}: {str(e)}")
-                time.sleep(sleep_time)  # Still respect rate limit on errors
+
+        if updates:
+            # One UPDATE with a DB-side CASE over the staged pks. Excluding
+            # rows that already hold their new URL makes the database both
+            # skip no-op writes and report how many rows actually changed
+            # via the update() rowcount — no Python-side change tracking.
+            whens = [When(pk=pk, then=Value(url)) for pk, _, url in updates]
+            new_url = Case(*whens, default=F('logo_url'), output_field=URLField())
+            with transaction.atomic():
+                # update() bypasses auto_now and signals, so stamp
+                # updated_at explicitly (it feeds the list endpoint's
+                # conditional-request validator) and bump the cache
+                # version by hand below
+                updated_count = Security.objects.filter(
+                    pk__in=[pk for pk, _, _ in updates]
+                ).exclude(logo_url=new_url).update(
+                    logo_url=new_url, updated_at=timezone.now()
+                )
+            if updated_count:
+                bump_securities_version()
+
+            results["updated"] += updated_count
+            results["skipped"] += len(updates) - updated_count
+            logger.info(
+                f"Updated {updated_count}/{len(updates)} staged logo URLs"
+            )
+
+        if fetched and not dry_run:
+            # Persist url/etag/fetched_at on the narrow SecurityLogo row so
+            # refetch bookkeeping never rewrites the wide Security row
+            pk_by_symbol = {symbol: pk for pk, symbol, _ in batch}
+            now = timezone.now()
+            SecurityLogo.objects.bulk_create(
+                [
+                    SecurityLogo(
+                        security_id=pk_by_symbol[symbol],
+                        url=url,
+                        etag=etag,
+                        fetched_at=now,
+                    )
+                    for symbol, url, etag in fetched
+                ],
+                update_conflicts=True,
+                unique_fields=["security"],
+                update_fields=["url", "etag", "fetched_at"],
+            )
+
+        if fetched and self.logo_cache and not dry_run:
+            self.logo_cache.put_many(fetched)
 
         return results
 
+    async def _fetch_profiles(
+        self,
+        symbols: List[str],
+        client: httpx.AsyncClient,
+        fmp_service,
+        limiter: TokenBucket,
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch company profiles for a chunk of symbols with a single API
+        call, gated by the semaphore and rate limiter. Retries with
+        exponential backoff + jitter when FMP returns 429.
+        """
+        async with semaphore:
+            for attempt in range(self.MAX_FETCH_ATTEMPTS):
+                await limiter.acquire()
+                try:
+                    response = await client.get(
+                        f"{fmp_service.BASE_URL}/profile",
+                        params={
+                            "symbol": ",".join(symbols),
+                            "apikey": fmp_service.api_key,
+                        },
+                    )
+                    if response.status_code == 429:
+                        backoff = (2 ** attempt) + random.uniform(0, 1)
+                        logger.warning(
+                            f"Rate limited fetching profiles for {len(symbols)} "
+                            f"symbols, retrying in {backoff:.1f}s"
+                        )
+                        await asyncio.sleep(backoff)
+                        continue
+
+                    response.raise_for_status()
+                    data = response.json()
+                    # FMP returns one profile object per known symbol on
+                    # success, but error payloads (bad key, quota hit)
+                    # come back as an HTTP-200 dict — treat anything
+                    # else as a failed chunk
+                    if not isinstance(data, list):
+                        logger.error(
+                            f"Unexpected profile payload for "
+                            f"{','.join(symbols)}: {str(data)[:200]}"
+                        )
+                        return {}
+                    return {
+                        profile["symbol"]: profile
+                        for profile in data
+                        if isinstance(profile, dict) and "symbol" in profile
+                    }
+
+                except Exception as e:
+                    logger.error(
+                        f"Error fetching profiles for {','.join(symbols)}: {str(e)}"
+                    )
+                    return {}
+
+        return {}
+
     def _is_valid_url(self, url: str) -> bool:
-        """Validate if the provided string is a valid URL."""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
\ No newline at end of file
+        """Validate if the provided string is a plausible http(s) URL.
+
+        FMP logo URLs are plain https links, so a scheme prefix plus a dot
+        in the host portion is enough — no URL grammar or regex needed.
+        """
+        return (
+            url.startswith(('http://', 'https://'))
+            and len(url) > 10
+            and '.' in url[7:]
+        )
\ No newline at end of file
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0007_remove_securityfundamentals_day_change_percent'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='security',
+            index=models.Index(condition=models.Q(('logo_url', ''), ('logo_url__isnull', True), _connector='OR'), fields=['is_active'], name='sec_missing_logo_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_logo_urls(apps, schema_editor):
+    """Seed SecurityLogo rows from the existing Security.logo_url values."""
+    Security = apps.get_model('securities', 'Security')
+    SecurityLogo = apps.get_model('securities', 'SecurityLogo')
+    SecurityLogo.objects.bulk_create(
+        (
+            SecurityLogo(security_id=pk, url=url)
+            for pk, url in Security.objects.exclude(logo_url='')
+            .exclude(logo_url__isnull=True)
+            .values_list('id', 'logo_url')
+            .iterator(chunk_size=2000)
+        ),
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0008_security_sec_missing_logo_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SecurityLogo',
+            fields=[
+                ('security', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='logo', serialize=False, to='securities.security')),
+                ('url', models.URLField(blank=True)),
+                ('etag', models.CharField(blank=True, max_length=64)),
+                ('fetched_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(copy_logo_urls, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:36
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0009_securitylogo'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='security',
+            index=models.Index(django.db.models.functions.text.Upper('symbol'), name='security_symbol_upper'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0010_security_security_symbol_upper'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='security',
+            index=models.Index(fields=['is_active', 'symbol'], name='security_list_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0011_security_security_list_idx'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='watchlistitem',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='watchlistitem',
+            constraint=models.UniqueConstraint(fields=('user', 'security'), name='uniq_watchlist'),
+        ),
+    ]
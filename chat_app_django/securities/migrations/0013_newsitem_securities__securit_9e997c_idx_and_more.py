@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0012_alter_watchlistitem_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['security', '-created_at'], name='securities__securit_9e997c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='upcomingevent',
+            index=models.Index(fields=['security', '-created_at'], name='securities__securit_842a14_idx'),
+        ),
+    ]
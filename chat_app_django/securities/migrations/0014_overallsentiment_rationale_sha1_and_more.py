@@ -0,0 +1,38 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:52
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_rationale_hashes(apps, schema_editor):
+    OverallSentiment = apps.get_model("securities", "OverallSentiment")
+    batch = []
+    for sentiment in OverallSentiment.objects.only("id", "rationale").iterator():
+        sentiment.rationale_sha1 = hashlib.sha1(
+            sentiment.rationale.encode("utf-8")
+        ).hexdigest()
+        batch.append(sentiment)
+    OverallSentiment.objects.bulk_update(batch, ["rationale_sha1"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0013_newsitem_securities__securit_9e997c_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='overallsentiment',
+            name='rationale_sha1',
+            field=models.CharField(default='', editable=False, help_text='SHA-1 of rationale, used for indexed deduplication', max_length=40),
+        ),
+        migrations.RunPython(
+            backfill_rationale_hashes, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='overallsentiment',
+            constraint=models.UniqueConstraint(fields=('sentiment', 'rationale_sha1'), name='uniq_sentiment_rationale'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.23 on 2026-08-29 03:55
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def drop_duplicate_urls(apps, schema_editor):
+    """Keep the oldest row per URL so the unique constraint can be added."""
+    NewsItem = apps.get_model("securities", "NewsItem")
+    duplicated = (
+        NewsItem.objects.values("url")
+        .annotate(n=Count("id"), keep_id=Min("id"))
+        .filter(n__gt=1)
+    )
+    for row in duplicated:
+        NewsItem.objects.filter(url=row["url"]).exclude(id=row["keep_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0014_overallsentiment_rationale_sha1_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_urls, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='newsitem',
+            constraint=models.UniqueConstraint(fields=('url',), name='uniq_newsitem_url'),
+        ),
+    ]
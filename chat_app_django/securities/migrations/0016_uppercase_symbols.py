@@ -0,0 +1,29 @@
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+def uppercase_symbols(apps, schema_editor):
+    """
+    Canonicalize any legacy mixed-case symbols so the exact-match
+    lookups introduced alongside Security.save() normalization hit them.
+    """
+    Security = apps.get_model("securities", "Security")
+    for security in Security.objects.exclude(symbol=Upper("symbol")):
+        upper = security.symbol.upper()
+        if Security.objects.filter(symbol=upper).exclude(pk=security.pk).exists():
+            # An upper-cased duplicate already exists; leave the row for
+            # manual resolution rather than violate the unique constraint
+            continue
+        security.symbol = upper
+        security.save(update_fields=["symbol"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0015_newsitem_uniq_newsitem_url'),
+    ]
+
+    operations = [
+        migrations.RunPython(uppercase_symbols, migrations.RunPython.noop),
+    ]
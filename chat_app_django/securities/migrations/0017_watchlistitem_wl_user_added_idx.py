@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-08-29 04:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('securities', '0016_uppercase_symbols'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='watchlistitem',
+            index=models.Index(fields=['user', '-added_at'], name='wl_user_added_idx'),
+        ),
+    ]
@@ -1,10 +1,25 @@
 from django.db import models
+from django.db.models import functions
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
 from decimal import Decimal
+import hashlib
 import uuid
 
 
+class SecurityManager(models.Manager):
+    """Manager with queryset helpers for serializer-facing views"""
+
+    def with_fundamentals(self):
+        """
+        Queryset pre-joined with the fundamentals row. Anything feeding
+        SecurityListSerializer / SecurityDetailSerializer must go through
+        this (or an equivalent select_related) or each serialized row
+        costs an extra query.
+        """
+        return self.select_related("fundamentals")
+
+
 class Security(models.Model):
     """Base model for stocks and ETFs"""
 
@@ -38,17 +53,60 @@ class Security(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SecurityManager()
+
     class Meta:
         ordering = ["symbol"]
         indexes = [
             models.Index(fields=["symbol"]),
+            models.Index(
+                functions.Upper("symbol"), name="security_symbol_upper"
+            ),
             models.Index(fields=["security_type", "is_active"]),
+            # Matches the list endpoint's filter + ordering so the scan
+            # walks the index in output order
+            models.Index(fields=["is_active", "symbol"], name="security_list_idx"),
+            # Partial index so selecting securities without logos
+            # (update_security_logos --missing-only) avoids a full scan
+            models.Index(
+                fields=["is_active"],
+                name="sec_missing_logo_idx",
+                condition=models.Q(logo_url="") | models.Q(logo_url__isnull=True),
+            ),
         ]
 
+    def save(self, *args, **kwargs):
+        # Tickers are case-insensitive by convention; storing them
+        # canonically upper-cased lets lookups use a plain exact match
+        # on the symbol btree instead of iexact
+        self.symbol = self.symbol.upper()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.symbol} - {self.name}"
 
 
+class SecurityLogo(models.Model):
+    """
+    Narrow companion row for logo data. Logo refreshes rewrite this small
+    row (url, etag, fetched_at) instead of the wide Security row, and the
+    ETag lets the update command skip refetching unchanged logos.
+    """
+
+    security = models.OneToOneField(
+        Security,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="logo",
+    )
+    url = models.URLField(blank=True)
+    etag = models.CharField(max_length=64, blank=True)
+    fetched_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.security.symbol} logo"
+
+
 class SecurityFundamentals(models.Model):
     """Fundamental data for securities"""
 
@@ -186,13 +244,67 @@ class WatchlistItem(models.Model):
     added_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ["user", "security"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "security"], name="uniq_watchlist"
+            ),
+        ]
+        indexes = [
+            # Matches the watchlist feed's filter + newest-first ordering
+            # so the scan walks the index without a sort step
+            models.Index(fields=["user", "-added_at"], name="wl_user_added_idx"),
+        ]
         ordering = ["added_at"]
 
     def __str__(self):
         return f"{self.security.symbol} in {self.user.username}'s watchlist"
 
 
+class HoldingManager(models.Manager):
+    """Manager with queryset helpers for portfolio calculations"""
+
+    def with_values(self):
+        """
+        Annotate holdings with market value and unrealized P&L computed in
+        the database (one JOIN instead of per-row Python property access).
+        """
+        market_value = models.ExpressionWrapper(
+            models.F("quantity") * models.F("security__fundamentals__current_price"),
+            output_field=models.DecimalField(max_digits=20, decimal_places=6),
+        )
+        return (
+            self.select_related("security", "security__fundamentals")
+            .annotate(market_value=market_value)
+            .annotate(
+                unrealized_pl=models.ExpressionWrapper(
+                    models.F("market_value") - models.F("total_cost"),
+                    output_field=models.DecimalField(max_digits=20, decimal_places=6),
+                )
+            )
+        )
+
+    def with_portfolio_weights(self):
+        """
+        Extend with_values() with portfolio totals and per-row weights
+        computed in one SQL pass via a window over the user's holdings.
+        Rows without a price fall back to cost basis, mirroring
+        PortfolioService's valuation rule.
+        """
+        row_value = functions.Coalesce(
+            models.F("market_value"), models.F("total_cost")
+        )
+        return self.with_values().annotate(
+            portfolio_value=models.Window(
+                models.Sum(row_value), partition_by=models.F("user_id")
+            )
+        ).annotate(
+            portfolio_weight_percent=models.ExpressionWrapper(
+                row_value * models.Value(100.0) / models.F("portfolio_value"),
+                output_field=models.FloatField(),
+            )
+        )
+
+
 class Holding(models.Model):
     """User's actual stock/ETF holdings"""
 
@@ -218,6 +330,8 @@ class Holding(models.Model):
     notes = models.TextField(blank=True)
     broker = models.CharField(max_length=100, blank=True)
 
+    objects = HoldingManager()
+
     class Meta:
         unique_together = ["user", "security"]
         ordering = ["-total_cost"]
@@ -229,8 +343,12 @@ class Holding(models.Model):
 
     @property
     def current_value(self):
-        """Calculate current market value"""
-        if self.security.fundamentals and self.security.fundamentals.current_price:
+        """Calculate current market value (fallback for unannotated rows)"""
+        if (
+            hasattr(self.security, "fundamentals")
+            and self.security.fundamentals
+            and self.security.fundamentals.current_price
+        ):
             return self.quantity * self.security.fundamentals.current_price
         return None
 
@@ -276,6 +394,12 @@ class OverallSentiment(models.Model):
     rationale = models.TextField(
         help_text="Explanation for the sentiment classification"
     )
+    rationale_sha1 = models.CharField(
+        max_length=40,
+        default="",
+        editable=False,
+        help_text="SHA-1 of rationale, used for indexed deduplication",
+    )
     confidence_level = models.CharField(
         max_length=10, choices=CONFIDENCE_CHOICES, blank=True, null=True
     )
@@ -286,6 +410,20 @@ class OverallSentiment(models.Model):
     class Meta:
         verbose_name = "Overall Sentiment"
         verbose_name_plural = "Overall Sentiments"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sentiment", "rationale_sha1"],
+                name="uniq_sentiment_rationale",
+            )
+        ]
+
+    @staticmethod
+    def hash_rationale(rationale: str) -> str:
+        return hashlib.sha1(rationale.encode("utf-8")).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.rationale_sha1 = self.hash_rationale(self.rationale)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.sentiment} - {self.rationale[:50]}..."
@@ -378,9 +516,13 @@ class NewsItem(models.Model):
         verbose_name = "News Item"
         verbose_name_plural = "News Items"
         ordering = ["-date", "-created_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["url"], name="uniq_newsitem_url")
+        ]
         indexes = [
             models.Index(fields=["security", "-date"]),
             models.Index(fields=["security", "impact_level", "-date"]),
+            models.Index(fields=["security", "-created_at"]),
         ]
 
     def __str__(self):
@@ -431,6 +573,7 @@ class UpcomingEvent(models.Model):
         indexes = [
             models.Index(fields=["security", "category"]),
             models.Index(fields=["security", "importance"]),
+            models.Index(fields=["security", "-created_at"]),
         ]
 
     def __str__(self):
@@ -1,3 +1,4 @@
+from django.db import IntegrityError
 from rest_framework import serializers
 from .models import (
     Security,
@@ -141,24 +142,64 @@ class SecurityFundamentalsSerializer(serializers.ModelSerializer):
 
 
 class SecurityListSerializer(serializers.ModelSerializer):
-    """Serializer for security list view (with fundamentals data)"""
-
-    current_price = serializers.SerializerMethodField()
-    previous_close = serializers.SerializerMethodField()
-    day_change = serializers.SerializerMethodField()
-    day_change_percent = serializers.SerializerMethodField()
-    market_cap = serializers.SerializerMethodField()
-    pe_ratio = serializers.SerializerMethodField()
-    eps = serializers.SerializerMethodField()
-    dividend_yield = serializers.SerializerMethodField()
-    volume = serializers.SerializerMethodField()
-    avg_volume = serializers.SerializerMethodField()
-    year_high = serializers.SerializerMethodField()
-    year_low = serializers.SerializerMethodField()
-    book_value = serializers.SerializerMethodField()
-    debt_to_equity = serializers.SerializerMethodField()
-    roe = serializers.SerializerMethodField()
-    news_summary = serializers.SerializerMethodField()
+    """
+    Serializer for security list view (with fundamentals data).
+
+    Fundamentals columns are mapped with dotted sources instead of
+    SerializerMethodFields, so rendering a row is plain attribute traversal
+    rather than 16 method dispatches. allow_null covers securities without
+    a fundamentals record yet. Callers must select_related("fundamentals")
+    on the queryset or every row triggers an extra query.
+    """
+
+    # FloatField instead of DecimalField on the read-only numeric columns:
+    # float(value) is a single C call per cell, where DecimalField would
+    # quantize each Decimal in Python. Display precision is unaffected.
+    current_price = serializers.FloatField(
+        source="fundamentals.current_price", read_only=True, allow_null=True
+    )
+    previous_close = serializers.FloatField(
+        source="fundamentals.previous_close", read_only=True, allow_null=True
+    )
+    day_change = serializers.FloatField(
+        source="fundamentals.day_change", read_only=True, allow_null=True
+    )
+    day_change_percent = serializers.FloatField(
+        source="fundamentals.day_change_percent", read_only=True, allow_null=True
+    )
+    market_cap = serializers.IntegerField(
+        source="fundamentals.market_cap", read_only=True, allow_null=True
+    )
+    pe_ratio = serializers.FloatField(
+        source="fundamentals.pe_ratio", read_only=True, allow_null=True
+    )
+    eps = serializers.FloatField(
+        source="fundamentals.eps", read_only=True, allow_null=True
+    )
+    dividend_yield = serializers.FloatField(
+        source="fundamentals.dividend_yield", read_only=True, allow_null=True
+    )
+    volume = serializers.IntegerField(
+        source="fundamentals.volume", read_only=True, allow_null=True
+    )
+    avg_volume = serializers.IntegerField(
+        source="fundamentals.avg_volume", read_only=True, allow_null=True
+    )
+    year_high = serializers.FloatField(
+        source="fundamentals.year_high", read_only=True, allow_null=True
+    )
+    year_low = serializers.FloatField(
+        source="fundamentals.year_low", read_only=True, allow_null=True
+    )
+    book_value = serializers.FloatField(
+        source="fundamentals.book_value", read_only=True, allow_null=True
+    )
+    debt_to_equity = serializers.FloatField(
+        source="fundamentals.debt_to_equity", read_only=True, allow_null=True
+    )
+    roe = serializers.FloatField(
+        source="fundamentals.roe", read_only=True, allow_null=True
+    )
 
     class Meta:
         model = Security
@@ -182,7 +223,6 @@ class SecurityListSerializer(serializers.ModelSerializer):
             "book_value",
             "debt_to_equity",
             "roe",
-            "news_summary",
             "logo_url",
             "is_active",
         ]
@@ -195,102 +235,6 @@ class SecurityListSerializer(serializers.ModelSerializer):
             "is_active",
         ]
 
-    def get_current_price(self, obj):
-        """Get current price from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.current_price
-        return None
-
-    def get_previous_close(self, obj):
-        """Get previous close from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.previous_close
-        return None
-
-    def get_day_change(self, obj):
-        """Get day change from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.day_change
-        return None
-
-    def get_day_change_percent(self, obj):
-        """Get day change percentage from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.day_change_percent
-        return None
-
-    def get_market_cap(self, obj):
-        """Get market cap from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.market_cap
-        return None
-
-    def get_pe_ratio(self, obj):
-        """Get P/E ratio from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.pe_ratio
-        return None
-
-    def get_eps(self, obj):
-        """Get EPS from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.eps
-        return None
-
-    def get_dividend_yield(self, obj):
-        """Get dividend yield from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.dividend_yield
-        return None
-
-    def get_volume(self, obj):
-        """Get volume from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.volume
-        return None
-
-    def get_avg_volume(self, obj):
-        """Get average volume from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.avg_volume
-        return None
-
-    def get_year_high(self, obj):
-        """Get 52-week high from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.year_high
-        return None
-
-    def get_year_low(self, obj):
-        """Get 52-week low from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.year_low
-        return None
-
-    def get_book_value(self, obj):
-        """Get book value from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.book_value
-        return None
-
-    def get_debt_to_equity(self, obj):
-        """Get debt-to-equity ratio from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.debt_to_equity
-        return None
-
-    def get_roe(self, obj):
-        """Get ROE from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.roe
-        return None
-
-    def get_news_summary(self, obj):
-        """Get news summary from fundamentals if available"""
-        if hasattr(obj, "fundamentals") and obj.fundamentals:
-            return obj.fundamentals.news_summary
-        return None
-
 
 class SecurityDetailSerializer(serializers.ModelSerializer):
     """Serializer for security detail view (complete data)"""
@@ -357,8 +301,10 @@ class WatchlistItemSerializer(serializers.ModelSerializer):
         user = self.context["request"].user
 
         try:
+            # Symbols are stored uppercase; an exact match on the upcased
+            # input uses the symbol index instead of an iexact scan
             security = Security.objects.get(
-                symbol__iexact=security_symbol, is_active=True
+                symbol=security_symbol.upper(), is_active=True
             )
         except Security.DoesNotExist:
             raise serializers.ValidationError(
@@ -367,19 +313,20 @@ class WatchlistItemSerializer(serializers.ModelSerializer):
                 }
             )
 
-        # Check if already in watchlist
-        if WatchlistItem.objects.filter(user=user, security=security).exists():
+        validated_data["security"] = security
+        validated_data["user"] = user
+
+        try:
+            # Let the (user, security) unique constraint detect duplicates
+            # instead of paying an exists() roundtrip before every insert
+            return super().create(validated_data)
+        except IntegrityError:
             raise serializers.ValidationError(
                 {
                     "security_symbol": f"Security '{security_symbol}' is already in your watchlist."
                 }
             )
 
-        validated_data["security"] = security
-        validated_data["user"] = user
-
-        return super().create(validated_data)
-
     def get_security_news_summary(self, obj):
         """Get SecurityNewsSummary data for the security"""
         if hasattr(obj.security, "news_summary") and obj.security.news_summary:
@@ -388,7 +335,11 @@ class WatchlistItemSerializer(serializers.ModelSerializer):
 
     def get_latest_news(self, obj):
         """Get the 3 most recent news items for the security"""
-        latest_news = obj.security.news_items.all()[:3]
+        # Views prefetch the top 3 into latest_news_prefetched; only fall
+        # back to a per-item query when serializing outside those views
+        latest_news = getattr(obj.security, "latest_news_prefetched", None)
+        if latest_news is None:
+            latest_news = obj.security.news_items.all()[:3]
         return NewsItemSerializer(latest_news, many=True).data
 
     def get_key_highlights(self, obj):
@@ -1,12 +1,76 @@
 from typing import List, Dict, Any, Optional
 import logging
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
 
 from .base_finance_service import FinanceBaseAPIService
 
 logger = logging.getLogger(__name__)
 
+# Fields copied out of FMP responses when shaping results
+_PROFILE_FIELDS = (
+    "symbol",
+    "companyName",
+    "price",
+    "marketCap",
+    "beta",
+    "lastDividend",
+    "range",
+    "change",
+    "changePercentage",
+    "volume",
+    "averageVolume",
+    "currency",
+    "cik",
+    "isin",
+    "cusip",
+    "exchangeFullName",
+    "exchange",
+    "industry",
+    "website",
+    "description",
+    "ceo",
+    "sector",
+    "country",
+    "fullTimeEmployees",
+    "phone",
+    "address",
+    "city",
+    "state",
+    "zip",
+    "image",
+    "ipoDate",
+    "defaultImage",
+    "isEtf",
+    "isActivelyTrading",
+    "isAdr",
+    "isFund",
+)
+
+_QUOTE_FIELDS = (
+    "symbol",
+    "name",
+    "price",
+    "changesPercentage",
+    "change",
+    "dayLow",
+    "dayHigh",
+    "yearHigh",
+    "yearLow",
+    "marketCap",
+    "priceAvg50",
+    "priceAvg200",
+    "exchange",
+    "volume",
+    "avgVolume",
+    "open",
+    "previousClose",
+    "timestamp",
+)
+
 
 class FinancialModelingPrepService(FinanceBaseAPIService):
     """
@@ -15,12 +79,27 @@ class FinancialModelingPrepService(FinanceBaseAPIService):
 
     BASE_URL = "https://financialmodelingprep.com/stable"
 
+    # (connect, read) timeout applied to every request
+    REQUEST_TIMEOUT = (3, 10)
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or getattr(settings, "FMP_API_KEY", None)
         if not self.api_key:
             raise ValueError("Financial Modeling Prep API key is required")
 
+        # Pooled session so repeated calls reuse the TCP+TLS connection
+        # instead of paying the handshake per request
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
 
     def _make_request(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -42,12 +121,17 @@ class FinancialModelingPrepService(FinanceBaseAPIService):
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            # orjson decodes the raw bytes several times faster than
+            # response.json(), which matters for large batch responses
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making request to FMP API: {str(e)}")
             return None
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding FMP API response: {str(e)}")
+            return None
 
     def get_ticker_details(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -65,48 +149,39 @@ class FinancialModelingPrepService(FinanceBaseAPIService):
                 return None
                 
             profile = data[0]  # FMP returns profile data as a list with one item
-            return {
-                "symbol": profile.get("symbol"),
-                "companyName": profile.get("companyName"),
-                "price": profile.get("price"),
-                "marketCap": profile.get("marketCap"),
-                "beta": profile.get("beta"),
-                "lastDividend": profile.get("lastDividend"),
-                "range": profile.get("range"),
-                "change": profile.get("change"),
-                "changePercentage": profile.get("changePercentage"),
-                "volume": profile.get("volume"),
-                "averageVolume": profile.get("averageVolume"),
-                "currency": profile.get("currency"),
-                "cik": profile.get("cik"),
-                "isin": profile.get("isin"),
-                "cusip": profile.get("cusip"),
-                "exchangeFullName": profile.get("exchangeFullName"),
-                "exchange": profile.get("exchange"),
-                "industry": profile.get("industry"),
-                "website": profile.get("website"),
-                "description": profile.get("description"),
-                "ceo": profile.get("ceo"),
-                "sector": profile.get("sector"),
-                "country": profile.get("country"),
-                "fullTimeEmployees": profile.get("fullTimeEmployees"),
-                "phone": profile.get("phone"),
-                "address": profile.get("address"),
-                "city": profile.get("city"),
-                "state": profile.get("state"),
-                "zip": profile.get("zip"),
-                "image": profile.get("image"),
-                "ipoDate": profile.get("ipoDate"),
-                "defaultImage": profile.get("defaultImage"),
-                "isEtf": profile.get("isEtf"),
-                "isActivelyTrading": profile.get("isActivelyTrading"),
-                "isAdr": profile.get("isAdr"),
-                "isFund": profile.get("isFund")
-            }
+            return {field: profile.get(field) for field in _PROFILE_FIELDS}
         except Exception as e:
             logger.error(f"Error fetching company profile for {symbol}: {str(e)}")
             return None
 
+    def get_ticker_details_bulk(
+        self, symbols: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get company profiles for several symbols with a single API call.
+
+        FMP's profile endpoint accepts a comma-separated symbol list, so one
+        request replaces len(symbols) individual calls.
+
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+
+        Returns:
+            Dict mapping each returned symbol to its raw profile data.
+            Symbols FMP doesn't know are simply absent from the result.
+        """
+        if not symbols:
+            return {}
+
+        try:
+            data = self._make_request(f"profile?symbol={','.join(symbols)}")
+            if not data:
+                return {}
+            return {profile["symbol"]: profile for profile in data}
+        except Exception as e:
+            logger.error(f"Error fetching company profiles in bulk: {str(e)}")
+            return {}
+
     def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get current quote for a ticker from Financial Modeling Prep.
@@ -123,37 +198,53 @@ class FinancialModelingPrepService(FinanceBaseAPIService):
                 return None
 
             quote = data[0]  # FMP returns quote data as a list with one item
-            return {
-                "symbol": quote.get("symbol"),
-                "name": quote.get("name"),
-                "price": quote.get("price"),
-                "changesPercentage": quote.get("changesPercentage"),
-                "change": quote.get("change"),
-                "dayLow": quote.get("dayLow"),
-                "dayHigh": quote.get("dayHigh"),
-                "yearHigh": quote.get("yearHigh"),
-                "yearLow": quote.get("yearLow"),
-                "marketCap": quote.get("marketCap"),
-                "priceAvg50": quote.get("priceAvg50"),
-                "priceAvg200": quote.get("priceAvg200"),
-                "exchange": quote.get("exchange"),
-                "volume": quote.get("volume"),
-                "avgVolume": quote.get("avgVolume"),
-                "open": quote.get("open"),
-                "previousClose": quote.get("previousClose"),
-                "timestamp": quote.get("timestamp"),
-            }
+            return {field: quote.get(field) for field in _QUOTE_FIELDS}
         except Exception as e:
             logger.error(f"Error fetching quote for {symbol}: {str(e)}")
             return None
 
+    def get_quotes_bulk(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current quotes for several symbols with a single API call.
+
+        FMP's quote endpoint accepts a comma-separated symbol list, so one
+        request replaces len(symbols) individual calls.
+
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+
+        Returns:
+            Dict mapping each returned symbol to its raw quote data.
+            Symbols FMP doesn't know are simply absent from the result.
+        """
+        if not symbols:
+            return {}
+
+        try:
+            data = self._make_request(f"quote?symbol={','.join(symbols)}")
+            if not data:
+                return {}
+            return {quote["symbol"]: quote for quote in data}
+        except Exception as e:
+            logger.error(f"Error fetching quotes in bulk: {str(e)}")
+            return {}
+
     def search_tickers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search for tickers matching query."""
         raise NotImplementedError("Method to be implemented later")
 
 
+_fmp_service: Optional[FinancialModelingPrepService] = None
+
+
 def get_fmp_service() -> FinancialModelingPrepService:
     """
     Factory function to get the Financial Modeling Prep API service.
+
+    Returns a module-level singleton so every caller shares one pooled
+    session (and its keep-alive connections).
     """
-    return FinancialModelingPrepService()
+    global _fmp_service
+    if _fmp_service is None:
+        _fmp_service = FinancialModelingPrepService()
+    return _fmp_service
@@ -1,333 +1,400 @@
-"""
-Data transformation layer for converting Pydantic models to Django model instances.
-"""
-
-import logging
-from datetime import datetime, date
-from typing import List, Optional
-from django.db import transaction
-from django.utils.dateparse import parse_date
-from django.conf import settings
-
-from ai_agents.schemas.news_schemas import StructuredStockAnalysis
-from securities.models import (
-    Security,
-    OverallSentiment,
-    SecurityNewsSummary,
-    NewsItem,
-    UpcomingEvent,
-    KeyHighlight,
-)
-
-# Configurable limits for data retention
-MAX_NEWS_ITEMS_PER_SECURITY = getattr(settings, "MAX_NEWS_ITEMS_PER_SECURITY", 20)
-MAX_UPCOMING_EVENTS_PER_SECURITY = getattr(
-    settings, "MAX_UPCOMING_EVENTS_PER_SECURITY", 20
-)
-
-logger = logging.getLogger(__name__)
-
-
-class NewsDataTransformer:
-    """Transform Pydantic analysis data to Django model instances"""
-
-    @staticmethod
-    def parse_date_string(date_str: str) -> Optional[date]:
-        """
-        Parse various date string formats to date object
-
-        Args:
-            date_str: Date string in various formats
-
-        Returns:
-            date object or None if parsing fails
-        """
-        if not date_str:
-            return None
-
-        # Try common date formats
-        formats = [
-            "%Y-%m-%d",  # 2024-01-15
-            "%m/%d/%Y",  # 01/15/2024
-            "%B %d, %Y",  # January 15, 2024
-            "%b %d, %Y",  # Jan 15, 2024
-            "%Y-%m-%d %H:%M:%S",  # Full datetime
-        ]
-
-        for fmt in formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt).date()
-                return parsed_date
-            except ValueError:
-                continue
-
-        # If no format works, try Django's parse_date
-        parsed_date = parse_date(date_str.strip())
-        if parsed_date:
-            return parsed_date
-
-        # For relative dates like "Q1 2025", "Late February 2025", return None
-        # These will be stored as-is in the event date field
-        logger.warning(f"Could not parse date: {date_str}")
-        return None
-
-    @staticmethod
-    @transaction.atomic
-    def save_analysis_to_db(
-        security: Security,
-        analysis: StructuredStockAnalysis,
-        max_news_items: int = None,
-        max_events: int = None,
-        skip_cleanup: bool = False,
-    ) -> SecurityNewsSummary:
-        """
-        Save complete analysis to database
-
-        Args:
-            security: Security instance
-            analysis: StructuredStockAnalysis from AI agent
-            max_news_items: Override for maximum news items (uses default if None)
-            max_events: Override for maximum events (uses default if None)
-            skip_cleanup: If True, skip cleanup operations
-
-        Returns:
-            SecurityNewsSummary instance
-        """
-        try:
-            logger.info(f"Saving analysis for {security.symbol}")
-
-            # 1. Create or reuse OverallSentiment (avoid duplicates)
-            sentiment, sentiment_created = OverallSentiment.objects.get_or_create(
-                sentiment=analysis.overall_sentiment.sentiment,
-                rationale=analysis.overall_sentiment.rationale,
-                defaults={
-                    "confidence_level": getattr(
-                        analysis.overall_sentiment, "confidence_level", None
-                    )
-                },
-            )
-
-            if sentiment_created:
-                logger.debug(f"Created new sentiment record for {security.symbol}")
-            else:
-                logger.debug(f"Reused existing sentiment record for {security.symbol}")
-
-            # 2. Create or update SecurityNewsSummary
-            news_summary, created = SecurityNewsSummary.objects.update_or_create(
-                security=security,
-                defaults={
-                    "executive_summary": analysis.executive_summary,
-                    "summary": analysis.summary,
-                    "positive_catalysts": analysis.positive_catalysts,
-                    "risk_factors": analysis.risk_factors,
-                    "overall_sentiment": sentiment,
-                    "key_metrics": analysis.key_metrics,
-                    "disclaimer": analysis.disclaimer,
-                },
-            )
-
-            if created:
-                logger.info(f"Created new SecurityNewsSummary for {security.symbol}")
-            else:
-                logger.info(f"Updated SecurityNewsSummary for {security.symbol}")
-
-            # 3. Clear and recreate KeyHighlights
-            KeyHighlight.objects.filter(security_news_summary=news_summary).delete()
-
-            for order, highlight in enumerate(analysis.key_highlights):
-                KeyHighlight.objects.create(
-                    security_news_summary=news_summary, highlight=highlight, order=order
-                )
-
-            logger.info(f"Created {len(analysis.key_highlights)} key highlights")
-
-            # 4. Add new NewsItems (avoid duplicates by URL) and manage retention
-            news_items_created = 0
-            for news_data in analysis.recent_news:
-                # Check if news item already exists by URL
-                if not NewsItem.objects.filter(url=news_data.url).exists():
-                    parsed_date = NewsDataTransformer.parse_date_string(news_data.date)
-
-                    # Use today if date parsing fails
-                    if not parsed_date:
-                        parsed_date = date.today()
-                        logger.warning(
-                            f"Using today's date for news item: {news_data.headline}"
-                        )
-
-                    NewsItem.objects.create(
-                        security=security,
-                        headline=news_data.headline,
-                        date=parsed_date,
-                        source=news_data.source,
-                        url=news_data.url,
-                        favicon=news_data.favicon,
-                        impact_level=news_data.impact_level,
-                        summary=news_data.summary,
-                    )
-                    news_items_created += 1
-                else:
-                    logger.debug(f"Skipping duplicate news item: {news_data.url}")
-
-            logger.info(f"Created {news_items_created} new news items")
-
-            # Clean up excess NewsItems to maintain rolling window
-            if not skip_cleanup:
-                effective_max_news = (
-                    max_news_items
-                    if max_news_items is not None
-                    else MAX_NEWS_ITEMS_PER_SECURITY
-                )
-                NewsDataTransformer.cleanup_excess_news_items(
-                    security, effective_max_news
-                )
-
-            # 5. Add new UpcomingEvents and manage retention
-            events_created = 0
-            for event_data in analysis.upcoming_events:
-                UpcomingEvent.objects.create(
-                    security=security,
-                    event=event_data.event,
-                    date=event_data.date,  # Store as string for flexible formats
-                    category=event_data.category,
-                    importance=event_data.importance,
-                )
-                events_created += 1
-
-            logger.info(f"Created {events_created} upcoming events")
-
-            # Clean up excess UpcomingEvents to maintain rolling window
-            if not skip_cleanup:
-                effective_max_events = (
-                    max_events
-                    if max_events is not None
-                    else MAX_UPCOMING_EVENTS_PER_SECURITY
-                )
-                NewsDataTransformer.cleanup_excess_upcoming_events(
-                    security, effective_max_events
-                )
-
-            logger.info(f"Successfully saved analysis for {security.symbol}")
-            return news_summary
-
-        except Exception as e:
-            logger.error(f"Error saving analysis for {security.symbol}: {e}")
-            raise
-
-    @staticmethod
-    def get_watchlisted_securities() -> List[Security]:
-        """
-        Get all unique securities that are in any user's watchlist
-
-        Returns:
-            List of Security instances
-        """
-        try:
-            from securities.models import WatchlistItem
-
-            # Get unique security IDs from watchlist items
-            security_ids = WatchlistItem.objects.values_list(
-                "security_id", flat=True
-            ).distinct()
-
-            # Get the Security objects
-            securities = Security.objects.filter(id__in=security_ids, is_active=True)
-
-            logger.info(f"Found {securities.count()} securities in watchlists")
-            return list(securities)
-
-        except Exception as e:
-            logger.error(f"Error getting watchlisted securities: {e}")
-            return []
-
-    @staticmethod
-    def get_security_by_symbol(symbol: str) -> Optional[Security]:
-        """
-        Get Security instance by symbol
-
-        Args:
-            symbol: Stock symbol
-
-        Returns:
-            Security instance or None
-        """
-        try:
-            return Security.objects.get(symbol=symbol.upper(), is_active=True)
-        except Security.DoesNotExist:
-            logger.warning(f"Security not found: {symbol}")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting security {symbol}: {e}")
-            return None
-
-    @staticmethod
-    def cleanup_excess_news_items(security: Security, max_items: int):
-        """
-        Clean up excess NewsItems for a security, keeping only the most recent ones
-
-        Args:
-            security: Security instance
-            max_items: Maximum number of items to keep
-        """
-        try:
-            total_count = NewsItem.objects.filter(security=security).count()
-
-            if total_count > max_items:
-                excess_count = total_count - max_items
-
-                # Get IDs of oldest items to delete
-                oldest_items = (
-                    NewsItem.objects.filter(security=security)
-                    .order_by("created_at")
-                    .values_list("id", flat=True)[:excess_count]
-                )
-
-                # Delete the oldest items
-                deleted_count = NewsItem.objects.filter(
-                    id__in=list(oldest_items)
-                ).delete()[0]
-
-                logger.info(
-                    f"Cleaned up {deleted_count} old news items for {security.symbol}, "
-                    f"keeping {max_items} most recent"
-                )
-
-        except Exception as e:
-            logger.error(f"Error cleaning up news items for {security.symbol}: {e}")
-
-    @staticmethod
-    def cleanup_excess_upcoming_events(security: Security, max_items: int):
-        """
-        Clean up excess UpcomingEvents for a security, keeping only the most recent ones
-
-        Args:
-            security: Security instance
-            max_items: Maximum number of items to keep
-        """
-        try:
-            total_count = UpcomingEvent.objects.filter(security=security).count()
-
-            if total_count > max_items:
-                excess_count = total_count - max_items
-
-                # Get IDs of oldest items to delete
-                oldest_items = (
-                    UpcomingEvent.objects.filter(security=security)
-                    .order_by("created_at")
-                    .values_list("id", flat=True)[:excess_count]
-                )
-
-                # Delete the oldest items
-                deleted_count = UpcomingEvent.objects.filter(
-                    id__in=list(oldest_items)
-                ).delete()[0]
-
-                logger.info(
-                    f"Cleaned up {deleted_count} old upcoming events for {security.symbol}, "
-                    f"keeping {max_items} most recent"
-                )
-
-        except Exception as e:
-            logger.error(
-                f"Error cleaning up upcoming events for {security.symbol}: {e}"
-            )
+"""
+Data transformation layer for converting Pydantic models to Django model instances.
+"""
+
+import logging
+from datetime import datetime, date
+from functools import lru_cache
+from typing import List, Optional
+from django.db import transaction
+from django.utils.dateparse import parse_date
+from django.conf import settings
+
+from ai_agents.schemas.news_schemas import StructuredStockAnalysis
+from securities.models import (
+    Security,
+    OverallSentiment,
+    SecurityNewsSummary,
+    NewsItem,
+    UpcomingEvent,
+    KeyHighlight,
+)
+
+# Configurable limits for data retention
+MAX_NEWS_ITEMS_PER_SECURITY = getattr(settings, "MAX_NEWS_ITEMS_PER_SECURITY", 20)
+MAX_UPCOMING_EVENTS_PER_SECURITY = getattr(
+    settings, "MAX_UPCOMING_EVENTS_PER_SECURITY", 20
+)
+
+logger = logging.getLogger(__name__)
+
+# Fallback formats for parse_date_string, tried only when the ISO
+# fast path misses (hoisted so each call skips the list rebuild)
+_DATE_FORMATS = (
+    "%m/%d/%Y",  # 01/15/2024
+    "%B %d, %Y",  # January 15, 2024
+    "%b %d, %Y",  # Jan 15, 2024
+)
+
+
+@lru_cache(maxsize=4096)
+def _security_pk_for_symbol(symbol: str) -> Optional[int]:
+    """
+    Memoized symbol -> pk lookup (symbol must already be upper-cased).
+    Batch ingestion revisits the same watchlist symbols run after run, so
+    this collapses the repeated SELECTs (including negative lookups for
+    unknown symbols). Cleared by Security post_save/post_delete signals.
+    """
+    return (
+        Security.objects.filter(symbol=symbol, is_active=True)
+        .values_list("pk", flat=True)
+        .first()
+    )
+
+
+class NewsDataTransformer:
+    """Transform Pydantic analysis data to Django model instances"""
+
+    @staticmethod
+    def parse_date_string(date_str: str) -> Optional[date]:
+        """
+        Parse various date string formats to date object
+
+        Args:
+            date_str: Date string in various formats
+
+        Returns:
+            date object or None if parsing fails
+        """
+        if not date_str:
+            return None
+
+        date_str = date_str.strip()
+
+        # Fast path: most feeds emit ISO dates ("2024-01-15", optionally
+        # with a time suffix). fromisoformat is C-implemented and skips
+        # the exception-per-format strptime ladder below.
+        try:
+            return date.fromisoformat(date_str[:10])
+        except ValueError:
+            pass
+
+        # Try the rarer formats
+        for fmt in _DATE_FORMATS:
+            try:
+                parsed_date = datetime.strptime(date_str, fmt).date()
+                return parsed_date
+            except ValueError:
+                continue
+
+        # If no format works, try Django's parse_date
+        parsed_date = parse_date(date_str)
+        if parsed_date:
+            return parsed_date
+
+        # For relative dates like "Q1 2025", "Late February 2025", return None
+        # These will be stored as-is in the event date field
+        logger.warning("Could not parse date: %s", date_str)
+        return None
+
+    @staticmethod
+    @transaction.atomic
+    def save_analysis_to_db(
+        security: Security,
+        analysis: StructuredStockAnalysis,
+        max_news_items: int = None,
+        max_events: int = None,
+        skip_cleanup: bool = False,
+    ) -> SecurityNewsSummary:
+        """
+        Save complete analysis to database
+
+        Args:
+            security: Security instance
+            analysis: StructuredStockAnalysis from AI agent
+            max_news_items: Override for maximum news items (uses default if None)
+            max_events: Override for maximum events (uses default if None)
+            skip_cleanup: If True, skip cleanup operations
+
+        Returns:
+            SecurityNewsSummary instance
+        """
+        try:
+            logger.info("Saving analysis for %s", security.symbol)
+
+            # 1. Create or reuse OverallSentiment (avoid duplicates).
+            # Match on the indexed rationale hash rather than comparing
+            # the full rationale text
+            sentiment, sentiment_created = OverallSentiment.objects.get_or_create(
+                sentiment=analysis.overall_sentiment.sentiment,
+                rationale_sha1=OverallSentiment.hash_rationale(
+                    analysis.overall_sentiment.rationale
+                ),
+                defaults={
+                    "rationale": analysis.overall_sentiment.rationale,
+                    # getattr stays: SentimentAnalysis doesn't declare
+                    # confidence_level, so direct access would raise
+                    "confidence_level": getattr(
+                        analysis.overall_sentiment, "confidence_level", None
+                    ),
+                },
+            )
+
+            if sentiment_created:
+                logger.debug("Created new sentiment record for %s", security.symbol)
+            else:
+                logger.debug("Reused existing sentiment record for %s", security.symbol)
+
+            # 2. Create or update SecurityNewsSummary
+            summary_fields = {
+                "executive_summary": analysis.executive_summary,
+                "summary": analysis.summary,
+                "positive_catalysts": analysis.positive_catalysts,
+                "risk_factors": analysis.risk_factors,
+                "overall_sentiment": sentiment,
+                "key_metrics": analysis.key_metrics,
+                "disclaimer": analysis.disclaimer,
+            }
+            news_summary, created = SecurityNewsSummary.objects.get_or_create(
+                security=security, defaults=summary_fields
+            )
+            if not created:
+                for field, value in summary_fields.items():
+                    setattr(news_summary, field, value)
+                # Scope the UPDATE to the analysis fields (update_fields must
+                # name updated_at explicitly for auto_now to fire)
+                news_summary.save(
+                    update_fields=[*summary_fields, "updated_at"]
+                )
+
+            if created:
+                logger.info("Created new SecurityNewsSummary for %s", security.symbol)
+            else:
+                logger.info("Updated SecurityNewsSummary for %s", security.symbol)
+
+            # 3. Diff KeyHighlights against the stored set so an unchanged
+            # analysis refresh writes nothing
+            existing_highlights = {
+                (h_order, h_text): h_id
+                for h_id, h_order, h_text in KeyHighlight.objects.filter(
+                    security_news_summary=news_summary
+                ).values_list("id", "order", "highlight")
+            }
+            new_highlights = {
+                (order, highlight)
+                for order, highlight in enumerate(analysis.key_highlights)
+            }
+
+            stale_ids = [
+                h_id
+                for key, h_id in existing_highlights.items()
+                if key not in new_highlights
+            ]
+            if stale_ids:
+                KeyHighlight.objects.filter(id__in=stale_ids).delete()
+
+            KeyHighlight.objects.bulk_create(
+                [
+                    KeyHighlight(
+                        security_news_summary=news_summary,
+                        highlight=highlight,
+                        order=order,
+                    )
+                    for order, highlight in new_highlights
+                    if (order, highlight) not in existing_highlights
+                ],
+                batch_size=500,
+            )
+
+            logger.info("Saved %d key highlights", len(analysis.key_highlights))
+
+            # 4. Add new NewsItems and manage retention. Duplicate URLs are
+            # discarded by the DB via the unique url constraint, so no
+            # pre-check query is needed
+            new_news_items = []
+            for news_data in analysis.recent_news:
+                parsed_date = NewsDataTransformer.parse_date_string(news_data.date)
+
+                # Use today if date parsing fails
+                if not parsed_date:
+                    parsed_date = date.today()
+                    logger.warning(
+                        f"Using today's date for news item: {news_data.headline}"
+                    )
+
+                new_news_items.append(
+                    NewsItem(
+                        security=security,
+                        headline=news_data.headline,
+                        date=parsed_date,
+                        source=news_data.source,
+                        url=news_data.url,
+                        favicon=news_data.favicon,
+                        impact_level=news_data.impact_level,
+                        summary=news_data.summary,
+                    )
+                )
+
+            NewsItem.objects.bulk_create(
+                new_news_items, ignore_conflicts=True, batch_size=500
+            )
+            logger.info("Saved %d news items", len(new_news_items))
+
+            # Clean up excess NewsItems to maintain rolling window
+            if not skip_cleanup:
+                effective_max_news = (
+                    max_news_items
+                    if max_news_items is not None
+                    else MAX_NEWS_ITEMS_PER_SECURITY
+                )
+                NewsDataTransformer.cleanup_excess_news_items(
+                    security, effective_max_news
+                )
+
+            # 5. Add new UpcomingEvents (one INSERT) and manage retention
+            upcoming_events = UpcomingEvent.objects.bulk_create(
+                [
+                    UpcomingEvent(
+                        security=security,
+                        event=event_data.event,
+                        date=event_data.date,  # Store as string for flexible formats
+                        category=event_data.category,
+                        importance=event_data.importance,
+                    )
+                    for event_data in analysis.upcoming_events
+                ],
+                batch_size=500,
+            )
+
+            logger.info("Created %d upcoming events", len(upcoming_events))
+
+            # Clean up excess UpcomingEvents to maintain rolling window
+            if not skip_cleanup:
+                effective_max_events = (
+                    max_events
+                    if max_events is not None
+                    else MAX_UPCOMING_EVENTS_PER_SECURITY
+                )
+                NewsDataTransformer.cleanup_excess_upcoming_events(
+                    security, effective_max_events
+                )
+
+            logger.info("Successfully saved analysis for %s", security.symbol)
+            return news_summary
+
+        except Exception as e:
+            logger.error("Error saving analysis for %s: %s", security.symbol, e)
+            raise
+
+    @staticmethod
+    def get_watchlisted_securities() -> List[Security]:
+        """
+        Get all unique securities that are in any user's watchlist
+
+        Returns:
+            List of Security instances
+        """
+        try:
+            # Single query: the watchlist membership check runs as a join
+            # instead of pulling the IDs into Python first
+            securities = list(
+                Security.objects.filter(
+                    watchlistitem__isnull=False, is_active=True
+                ).distinct()
+            )
+
+            logger.info("Found %d securities in watchlists", len(securities))
+            return securities
+
+        except Exception as e:
+            logger.error("Error getting watchlisted securities: %s", e)
+            return []
+
+    @staticmethod
+    def get_security_by_symbol(symbol: str) -> Optional[Security]:
+        """
+        Get Security instance by symbol
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Security instance or None
+        """
+        try:
+            pk = _security_pk_for_symbol(symbol.upper())
+            if pk is None:
+                logger.warning("Security not found: %s", symbol)
+                return None
+            return Security.objects.get(pk=pk)
+        except Security.DoesNotExist:
+            logger.warning("Security not found: %s", symbol)
+            return None
+        except Exception as e:
+            logger.error("Error getting security %s: %s", symbol, e)
+            return None
+
+    @staticmethod
+    def _trim_to_most_recent(model, security: Security, max_items: int) -> int:
+        """
+        Delete all but the max_items most recently created rows for a
+        security in a single DELETE (the keep-set runs as a subquery).
+
+        Returns the number of rows deleted.
+        """
+        keep_ids = (
+            model.objects.filter(security=security)
+            .order_by("-created_at")
+            .values("id")[:max_items]
+        )
+        return (
+            model.objects.filter(security=security)
+            .exclude(id__in=keep_ids)
+            .delete()[0]
+        )
+
+    @staticmethod
+    def cleanup_excess_news_items(security: Security, max_items: int):
+        """
+        Clean up excess NewsItems for a security, keeping only the most recent ones
+
+        Args:
+            security: Security instance
+            max_items: Maximum number of items to keep
+        """
+        try:
+            deleted_count = NewsDataTransformer._trim_to_most_recent(
+                NewsItem, security, max_items
+            )
+            if deleted_count:
+                logger.info(
+                    f"Cleaned up {deleted_count} old news items for {security.symbol}, "
+                    f"keeping {max_items} most recent"
+                )
+
+        except Exception as e:
+            logger.error("Error cleaning up news items for %s: %s", security.symbol, e)
+
+    @staticmethod
+    def cleanup_excess_upcoming_events(security: Security, max_items: int):
+        """
+        Clean up excess UpcomingEvents for a security, keeping only the most recent ones
+
+        Args:
+            security: Security instance
+            max_items: Maximum number of items to keep
+        """
+        try:
+            deleted_count = NewsDataTransformer._trim_to_most_recent(
+                UpcomingEvent, security, max_items
+            )
+            if deleted_count:
+                logger.info(
+                    f"Cleaned up {deleted_count} old upcoming events for {security.symbol}, "
+                    f"keeping {max_items} most recent"
+                )
+
+        except Exception as e:
+            logger.error(
+                f"Error cleaning up upcoming events for {security.symbol}: {e}"
+            )
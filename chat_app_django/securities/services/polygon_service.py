@@ -1,12 +1,130 @@
 from typing import List, Dict, Any, Optional
+import asyncio
+import functools
 import logging
+import operator
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import httpx
 from polygon import RESTClient
 from django.conf import settings
+from django.core.cache import cache
 
 from .base_finance_service import FinanceBaseAPIService
 
 logger = logging.getLogger(__name__)
 
+# Output keys for shaped ticker rows and the matching C-level attribute
+# reader (symbol comes from the client's `ticker` attribute)
+_TICKER_FIELDS = (
+    "symbol",
+    "name",
+    "market",
+    "locale",
+    "primary_exchange",
+    "type",
+    "currency_name",
+    "last_updated_utc",
+)
+_read_ticker = operator.attrgetter(
+    "ticker",
+    "name",
+    "market",
+    "locale",
+    "primary_exchange",
+    "type",
+    "currency_name",
+    "last_updated_utc",
+)
+
+# Single-flight bookkeeping for cached_single_flight: concurrent callers
+# asking for the same key wait on one in-flight fetch instead of each
+# hitting Polygon
+_MISS = object()
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket smoothing outgoing Polygon calls.
+
+    Fan-out helpers (thread pool, asyncio.gather) can otherwise burst past
+    Polygon's rate limit, and the resulting 429 retries cost far more than
+    briefly waiting for a token here.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def cached_single_flight(prefix: str, ttl: int):
+    """
+    Cache a read method's result in the Django cache for ttl seconds,
+    coalescing concurrent duplicate calls into one upstream request.
+
+    Keys are built from the method's positional/keyword arguments, e.g.
+    polygon:ticker_details:AAPL.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            parts = [f"polygon:{prefix}", *map(str, args)]
+            parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
+            key = ":".join(parts)
+
+            value = cache.get(key, _MISS)
+            if value is not _MISS:
+                return value
+
+            with _inflight_lock:
+                future = _inflight.get(key)
+                is_owner = future is None
+                if is_owner:
+                    future = Future()
+                    _inflight[key] = future
+
+            if not is_owner:
+                return future.result()
+
+            try:
+                value = method(self, *args, **kwargs)
+                cache.set(key, value, ttl)
+                future.set_result(value)
+                return value
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _inflight_lock:
+                    _inflight.pop(key, None)
+
+        return wrapper
+
+    return decorator
+
 
 class PolygonAPIService(FinanceBaseAPIService):
     """
@@ -19,7 +137,11 @@ class PolygonAPIService(FinanceBaseAPIService):
             raise ValueError("Polygon API key is required")
 
         self.client = RESTClient(self.api_key)
+        # Client-side throttle shared by all methods on this (singleton)
+        # instance; POLYGON_RPS caps sustained requests per second
+        self._bucket = _TokenBucket(rate=getattr(settings, "POLYGON_RPS", 20))
 
+    @cached_single_flight("ticker_details", ttl=300)
     def get_ticker_details(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed ticker information from Polygon.
@@ -31,6 +153,7 @@ class PolygonAPIService(FinanceBaseAPIService):
             Dict containing ticker details or None if not found
         """
         try:
+            self._bucket.acquire()
             ticker_details = self.client.get_ticker_details(symbol)
             return {
                 "symbol": ticker_details.ticker,
@@ -57,6 +180,7 @@ class PolygonAPIService(FinanceBaseAPIService):
             logger.error(f"Error fetching ticker details for {symbol}: {str(e)}")
             return None
 
+    @cached_single_flight("quote", ttl=5)
     def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get current quote for a ticker.
@@ -68,6 +192,7 @@ class PolygonAPIService(FinanceBaseAPIService):
             Dict containing quote data or None if not found
         """
         try:
+            self._bucket.acquire()
             quote = self.client.get_last_quote(symbol)
             return {
                 "symbol": symbol,
@@ -100,6 +225,80 @@ class PolygonAPIService(FinanceBaseAPIService):
             logger.error(f"Error fetching quote for {symbol}: {str(e)}")
             return None
 
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for several symbols with a single snapshot request.
+
+        One call to the snapshot endpoint replaces len(symbols) per-symbol
+        round-trips; prefer this over get_quotes_bulk when the snapshot
+        data (last trade/quote) is sufficient.
+
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+
+        Returns:
+            Dict mapping each returned symbol to a quote dict shaped like
+            get_quote's result. Unknown symbols are simply absent.
+        """
+        if not symbols:
+            return {}
+
+        try:
+            quotes = {}
+            self._bucket.acquire()
+            for snapshot in self.client.get_snapshot_all("stocks", tickers=symbols):
+                last_quote = getattr(snapshot, "last_quote", None)
+                last_trade = getattr(snapshot, "last_trade", None)
+                quotes[snapshot.ticker] = {
+                    "symbol": snapshot.ticker,
+                    "last_price": (
+                        last_trade.price if last_trade is not None else None
+                    ),
+                    "bid": last_quote.bid if last_quote is not None else None,
+                    "ask": last_quote.ask if last_quote is not None else None,
+                    "bid_size": (
+                        last_quote.bid_size if last_quote is not None else None
+                    ),
+                    "ask_size": (
+                        last_quote.ask_size if last_quote is not None else None
+                    ),
+                    "timestamp": (
+                        last_quote.timestamp if last_quote is not None else None
+                    ),
+                }
+            return quotes
+        except Exception as e:
+            logger.error(f"Error fetching snapshot quotes: {str(e)}")
+            return {}
+
+    def get_quotes_bulk(
+        self, symbols: List[str], max_workers: int = 16
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch quotes for several symbols in parallel.
+
+        The per-symbol calls are I/O-bound (the GIL is released during
+        socket reads), so a thread pool turns N serial round-trips into
+        roughly ceil(N / max_workers). get_quote already catches request
+        errors and returns None, so failures stay isolated per symbol.
+
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+            max_workers: Upper bound on concurrent requests
+
+        Returns:
+            Dict mapping each symbol to its quote dict (or None)
+        """
+        if not symbols:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_quote, symbol): symbol
+                for symbol in symbols
+            }
+            return {futures[f]: f.result() for f in as_completed(futures)}
+
     def get_previous_close(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get previous day's close for a ticker.
@@ -111,6 +310,7 @@ class PolygonAPIService(FinanceBaseAPIService):
             Dict containing previous close data or None if not found
         """
         try:
+            self._bucket.acquire()
             prev_close = self.client.get_previous_close_agg(symbol)
             if prev_close and len(prev_close) > 0:
                 data = prev_close[0]
@@ -128,6 +328,7 @@ class PolygonAPIService(FinanceBaseAPIService):
             logger.error(f"Error fetching previous close for {symbol}: {str(e)}")
             return None
 
+    @cached_single_flight("search_tickers", ttl=300)
     def search_tickers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Search for tickers matching query.
@@ -140,32 +341,23 @@ class PolygonAPIService(FinanceBaseAPIService):
             List of ticker dictionaries
         """
         try:
-            results = []
-            for ticker in self.client.list_tickers(
-                search=query,
-                market="stocks",
-                active=True,
-                limit=limit,
-                sort="ticker",
-                order="asc",
-            ):
-                results.append(
-                    {
-                        "symbol": ticker.ticker,
-                        "name": ticker.name,
-                        "market": ticker.market,
-                        "locale": ticker.locale,
-                        "primary_exchange": ticker.primary_exchange,
-                        "type": ticker.type,
-                        "currency_name": ticker.currency_name,
-                        "last_updated_utc": ticker.last_updated_utc,
-                    }
+            self._bucket.acquire()
+            return [
+                dict(zip(_TICKER_FIELDS, _read_ticker(ticker)))
+                for ticker in self.client.list_tickers(
+                    search=query,
+                    market="stocks",
+                    active=True,
+                    limit=limit,
+                    sort="ticker",
+                    order="asc",
                 )
-            return results
+            ]
         except Exception as e:
             logger.error(f"Error searching tickers for query '{query}': {str(e)}")
             return []
 
+    @cached_single_flight("tickers_by_exchange", ttl=300)
     def list_tickers_by_exchange(
         self, exchange: str = "XNYS", limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -180,32 +372,23 @@ class PolygonAPIService(FinanceBaseAPIService):
             List of ticker dictionaries
         """
         try:
-            results = []
-            for ticker in self.client.list_tickers(
-                market="stocks",
-                exchange=exchange,
-                active=True,
-                limit=limit,
-                sort="ticker",
-                order="asc",
-            ):
-                results.append(
-                    {
-                        "symbol": ticker.ticker,
-                        "name": ticker.name,
-                        "market": ticker.market,
-                        "locale": ticker.locale,
-                        "primary_exchange": ticker.primary_exchange,
-                        "type": ticker.type,
-                        "currency_name": ticker.currency_name,
-                        "last_updated_utc": ticker.last_updated_utc,
-                    }
+            self._bucket.acquire()
+            return [
+                dict(zip(_TICKER_FIELDS, _read_ticker(ticker)))
+                for ticker in self.client.list_tickers(
+                    market="stocks",
+                    exchange=exchange,
+                    active=True,
+                    limit=limit,
+                    sort="ticker",
+                    order="asc",
                 )
-            return results
+            ]
         except Exception as e:
             logger.error(f"Error listing tickers for exchange {exchange}: {str(e)}")
             return []
 
+    @cached_single_flight("news", ttl=300)
     def get_news(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get news articles for a ticker.
@@ -219,6 +402,7 @@ class PolygonAPIService(FinanceBaseAPIService):
         """
         try:
             results = []
+            self._bucket.acquire()
             for article in self.client.list_ticker_news(
                 ticker=symbol, limit=limit, sort="published_utc", order="desc"
             ):
@@ -241,8 +425,173 @@ class PolygonAPIService(FinanceBaseAPIService):
             return []
 
 
+class AsyncPolygonAPIService:
+    """
+    Async Polygon.io client for batch enrichment paths.
+
+    Talks to the REST API directly through a shared httpx.AsyncClient, so
+    per-symbol calls can be fanned out with asyncio.gather instead of
+    serializing one blocking round-trip per symbol.
+    """
+
+    BASE_URL = "https://api.polygon.io"
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or getattr(settings, "POLYGON_API_KEY", None)
+        if not self.api_key:
+            raise ValueError("Polygon API key is required")
+
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=10,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            params={"apiKey": self.api_key},
+        )
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def _get(self, path: str, **params) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self._client.get(path, params=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            logger.error("Error fetching %s from Polygon: %s", path, e)
+            return None
+
+    async def get_ticker_details(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of PolygonAPIService.get_ticker_details."""
+        data = await self._get(f"/v3/reference/tickers/{symbol}")
+        if not data or "results" not in data:
+            return None
+
+        details = data["results"]
+        return {
+            "symbol": details.get("ticker"),
+            "name": details.get("name"),
+            "market": details.get("market"),
+            "locale": details.get("locale"),
+            "primary_exchange": details.get("primary_exchange"),
+            "type": details.get("type"),
+            "currency_name": details.get("currency_name"),
+            "description": details.get("description", ""),
+            "homepage_url": details.get("homepage_url", ""),
+            "logo_url": details.get("branding", {}).get("logo_url", ""),
+            "market_cap": details.get("market_cap"),
+            "share_class_shares_outstanding": details.get(
+                "share_class_shares_outstanding"
+            ),
+            "sic_description": details.get("sic_description", ""),
+        }
+
+    async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of PolygonAPIService.get_quote."""
+        data = await self._get(f"/v2/last/nbbo/{symbol}")
+        if not data or "results" not in data:
+            return None
+
+        quote = data["results"]
+        return {
+            "symbol": symbol,
+            "last_price": quote.get("p"),
+            "bid": quote.get("p"),
+            "ask": quote.get("P"),
+            "bid_size": quote.get("s"),
+            "ask_size": quote.get("S"),
+            "timestamp": quote.get("t"),
+        }
+
+    async def get_previous_close(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of PolygonAPIService.get_previous_close."""
+        data = await self._get(f"/v2/aggs/ticker/{symbol}/prev")
+        if not data or not data.get("results"):
+            return None
+
+        agg = data["results"][0]
+        return {
+            "symbol": symbol,
+            "close": agg.get("c"),
+            "high": agg.get("h"),
+            "low": agg.get("l"),
+            "open": agg.get("o"),
+            "volume": agg.get("v"),
+            "vwap": agg.get("vw"),
+            "timestamp": agg.get("t"),
+        }
+
+    async def get_news(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Async counterpart of PolygonAPIService.get_news."""
+        data = await self._get(
+            "/v2/reference/news",
+            ticker=symbol,
+            limit=limit,
+            sort="published_utc",
+            order="desc",
+        )
+        if not data or not data.get("results"):
+            return []
+
+        return [
+            {
+                "id": article.get("id"),
+                "title": article.get("title"),
+                "author": article.get("author"),
+                "published_utc": article.get("published_utc"),
+                "article_url": article.get("article_url"),
+                "description": article.get("description", ""),
+                "keywords": article.get("keywords", []),
+                "image_url": article.get("image_url", ""),
+                "amp_url": article.get("amp_url", ""),
+            }
+            for article in data["results"]
+        ]
+
+    async def get_quotes_bulk(
+        self, symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch quotes for all symbols concurrently.
+
+        Returns a dict mapping each symbol to its quote (None for symbols
+        whose fetch failed; errors are isolated per symbol).
+        """
+        results = await asyncio.gather(
+            *[self.get_quote(symbol) for symbol in symbols],
+            return_exceptions=True,
+        )
+        quotes = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error("Error fetching quote for %s: %s", symbol, result)
+                quotes[symbol] = None
+            else:
+                quotes[symbol] = result
+        return quotes
+
+
+_async_polygon_service: Optional[AsyncPolygonAPIService] = None
+
+
+def get_async_polygon_service() -> AsyncPolygonAPIService:
+    """
+    Factory function to get the async Polygon API service.
+
+    Returns a module-level singleton so callers share one connection pool
+    and TCP+TLS handshakes are amortized across requests.
+    """
+    global _async_polygon_service
+    if _async_polygon_service is None:
+        _async_polygon_service = AsyncPolygonAPIService()
+    return _async_polygon_service
+
+
+@functools.lru_cache(maxsize=1)
 def get_polygon_service() -> PolygonAPIService:
     """
     Factory function to get the Polygon API service.
+
+    Cached so every caller shares one RESTClient (and its urllib3
+    connection pool) instead of re-handshaking per instantiation.
     """
     return PolygonAPIService()
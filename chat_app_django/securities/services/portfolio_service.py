@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from typing import List, Optional
 from decimal import Decimal
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
+from django.db.models import Count, F, QuerySet, Sum
+from django.db.models.functions import Coalesce
 
 from ..models import Holding
 
@@ -27,15 +28,22 @@ class HoldingWithComposition:
     @property
     def unrealized_gain_loss(self) -> Optional[Decimal]:
         """Get unrealized gain/loss from the holding"""
+        # Prefer the DB-computed annotation from with_values(); fall back
+        # to the model property for unannotated instances
+        value = getattr(self.holding, "unrealized_pl", None)
+        if value is not None:
+            return value
         return self.holding.unrealized_gain_loss
     
     @property
     def unrealized_gain_loss_percent(self) -> Optional[float]:
         """Calculate unrealized gain/loss percentage"""
         if self.holding.total_cost and self.holding.total_cost > 0:
-            gain_loss = self.holding.unrealized_gain_loss
+            gain_loss = self.unrealized_gain_loss
             if gain_loss is not None:
-                return float((gain_loss / self.holding.total_cost) * 100)
+                # Display-only ratio: hardware float division beats an
+                # arbitrary-precision Decimal divide
+                return float(gain_loss) / float(self.holding.total_cost) * 100.0
         return None
 
 
@@ -52,12 +60,14 @@ class PortfolioService:
     @staticmethod
     def get_user_holdings_queryset(user: User) -> QuerySet[Holding]:
         """Get optimized queryset of user's holdings"""
-        return Holding.objects.filter(
+        # news_summary is the one wide TextField on the fundamentals join
+        # and nothing in the holdings serializers reads it. The empty
+        # order_by() clears Holding.Meta.ordering (-total_cost): the
+        # composition pass sorts the final list by weight, so a DB sort
+        # here would just be thrown away.
+        return Holding.objects.with_portfolio_weights().filter(
             user=user
-        ).select_related(
-            'security', 
-            'security__fundamentals'
-        ).order_by('-total_cost')
+        ).defer('security__fundamentals__news_summary').order_by()
     
     @staticmethod
     def calculate_portfolio_composition(user: User) -> PortfolioData:
@@ -71,39 +81,45 @@ class PortfolioService:
             PortfolioData with holdings and summary metrics
         """
         holdings_queryset = PortfolioService.get_user_holdings_queryset(user)
-        
-        # Calculate total portfolio value and prepare holdings data
+
+        # Row values, the portfolio total and each weight all come
+        # annotated from with_portfolio_weights() in a single SQL pass;
+        # the summary totals accumulate in the same loop
         total_portfolio_value = Decimal('0')
-        holdings_with_values = []
-        
+        total_cost = Decimal('0')
+        total_unrealized_gain_loss = Decimal('0')
+        holdings_with_composition = []
+
         for holding in holdings_queryset:
-            current_value = holding.current_value
-            # Use current market value if available, otherwise use cost basis
+            # market_value is annotated in SQL; None means the security has
+            # no fundamentals (or no price) yet, so cost basis stands in
+            current_value = holding.market_value
             value_for_calculation = current_value if current_value is not None else holding.total_cost
-            
-            total_portfolio_value += value_for_calculation
-            holdings_with_values.append((holding, value_for_calculation))
-        
-        # Calculate portfolio composition percentages
-        holdings_with_composition = []
-        for holding, current_value in holdings_with_values:
-            if total_portfolio_value > 0:
-                weight_percent = float((current_value / total_portfolio_value) * 100)
-            else:
-                weight_percent = 0.0
-                
+
+            total_portfolio_value = holding.portfolio_value
+            total_cost += holding.total_cost
+            total_unrealized_gain_loss += holding.unrealized_pl or Decimal('0')
+            weight_percent = holding.portfolio_weight_percent or 0.0
+
             holdings_with_composition.append(
                 HoldingWithComposition(
                     holding=holding,
-                    current_value=current_value,
+                    current_value=value_for_calculation,
                     portfolio_weight_percent=round(weight_percent, 2)
                 )
             )
-        
-        # Calculate summary metrics
+
+        # Largest positions first; one Timsort here replaces the DB sort
+        holdings_with_composition.sort(
+            key=lambda h: h.portfolio_weight_percent, reverse=True
+        )
+
+        # Calculate summary metrics from the accumulated totals
         summary = PortfolioService._calculate_portfolio_summary(
-            holdings_with_composition, 
-            total_portfolio_value
+            total_portfolio_value,
+            total_cost,
+            total_unrealized_gain_loss,
+            len(holdings_with_composition)
         )
         
         return PortfolioData(
@@ -115,32 +131,59 @@ class PortfolioService:
     def get_portfolio_summary(user: User) -> PortfolioSummary:
         """
         Get portfolio summary metrics only (faster than full composition).
-        
+
+        The totals are aggregated in one SQL query over the with_values()
+        annotations instead of materializing every holding just to sum
+        them in Python.
+
         Args:
             user: User to get summary for
-            
+
         Returns:
             PortfolioSummary with total metrics
         """
-        portfolio_data = PortfolioService.calculate_portfolio_composition(user)
-        return portfolio_data.summary
+        zero = Decimal('0')
+        agg = Holding.objects.with_values().filter(user=user).aggregate(
+            total_portfolio_value=Coalesce(
+                Sum(Coalesce(F('market_value'), F('total_cost'))), zero
+            ),
+            total_cost=Coalesce(Sum('total_cost'), zero),
+            # Sum skips NULL unrealized_pl rows (holdings without a price),
+            # matching the `or Decimal('0')` in the composition path
+            total_unrealized_gain_loss=Coalesce(Sum('unrealized_pl'), zero),
+            holdings_count=Count('id'),
+        )
+
+        if agg['total_cost'] > 0:
+            gain_loss_percent = (
+                float(agg['total_unrealized_gain_loss'])
+                / float(agg['total_cost'])
+                * 100.0
+            )
+        else:
+            gain_loss_percent = 0.0
+
+        return PortfolioSummary(
+            total_portfolio_value=agg['total_portfolio_value'],
+            total_cost=agg['total_cost'],
+            total_unrealized_gain_loss=agg['total_unrealized_gain_loss'],
+            total_unrealized_gain_loss_percent=round(gain_loss_percent, 2),
+            holdings_count=agg['holdings_count'],
+        )
     
     @staticmethod
     def _calculate_portfolio_summary(
-        holdings_with_composition: List[HoldingWithComposition],
-        total_portfolio_value: Decimal
+        total_portfolio_value: Decimal,
+        total_cost: Decimal,
+        total_unrealized_gain_loss: Decimal,
+        holdings_count: int
     ) -> PortfolioSummary:
-        """Calculate summary metrics from holdings data"""
-        total_cost = sum(holding.holding.total_cost for holding in holdings_with_composition)
-        total_unrealized_gain_loss = sum(
-            holding.holding.unrealized_gain_loss or Decimal('0') 
-            for holding in holdings_with_composition
-        )
-        
-        # Calculate total unrealized gain/loss percentage
+        """Calculate summary metrics from totals accumulated by the caller"""
+        # Calculate total unrealized gain/loss percentage (display-only,
+        # so float division is fine; the totals stay Decimal)
         if total_cost > 0:
-            total_unrealized_gain_loss_percent = float(
-                (total_unrealized_gain_loss / total_cost) * 100
+            total_unrealized_gain_loss_percent = (
+                float(total_unrealized_gain_loss) / float(total_cost) * 100.0
             )
         else:
             total_unrealized_gain_loss_percent = 0.0
@@ -150,5 +193,5 @@ class PortfolioService:
             total_cost=total_cost,
             total_unrealized_gain_loss=total_unrealized_gain_loss,
             total_unrealized_gain_loss_percent=round(total_unrealized_gain_loss_percent, 2),
-            holdings_count=len(holdings_with_composition)
+            holdings_count=holdings_count
         )
\ No newline at end of file
@@ -0,0 +1,71 @@
+import sys
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Security, SecurityFundamentals, WatchlistItem
+
+# Monotonic counter baked into security list cache keys. Bumping it on
+# writes makes every previously cached page unreachable, so invalidation
+# is lock-free and never needs to enumerate cached keys.
+SECURITIES_VERSION_KEY = "securities:list:version"
+
+
+def get_securities_version() -> int:
+    """Current cache version for security list responses."""
+    return cache.get_or_set(SECURITIES_VERSION_KEY, 1, None)
+
+
+def bump_securities_version():
+    """Invalidate all cached security list responses."""
+    try:
+        cache.incr(SECURITIES_VERSION_KEY)
+    except ValueError:
+        # Counter not in the cache yet (or evicted); seed it
+        cache.set(SECURITIES_VERSION_KEY, 1, None)
+
+
+@receiver(post_save, sender=Security)
+@receiver(post_delete, sender=Security)
+@receiver(post_save, sender=SecurityFundamentals)
+@receiver(post_delete, sender=SecurityFundamentals)
+def _invalidate_security_list_cache(sender, **kwargs):
+    bump_securities_version()
+
+
+# Same counter scheme, scoped per user, for the serialized watchlist
+# feed. Adds/removes bump only that user's version.
+WATCHLIST_VERSION_KEY = "watchlist:{}:version"
+
+
+def get_watchlist_version(user_id: int) -> int:
+    """Current cache version for a user's watchlist response."""
+    return cache.get_or_set(WATCHLIST_VERSION_KEY.format(user_id), 1, None)
+
+
+def bump_watchlist_version(user_id: int):
+    """Invalidate a user's cached watchlist response."""
+    key = WATCHLIST_VERSION_KEY.format(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+@receiver(post_save, sender=WatchlistItem)
+@receiver(post_delete, sender=WatchlistItem)
+def _invalidate_watchlist_cache(sender, instance, **kwargs):
+    bump_watchlist_version(instance.user_id)
+
+
+@receiver(post_save, sender=Security)
+@receiver(post_delete, sender=Security)
+def _invalidate_symbol_lookup_cache(sender, **kwargs):
+    # Only clear the memoized lookup when the transformer module is
+    # actually loaded; don't pull in its (heavy) import chain otherwise
+    transformer = sys.modules.get(
+        "securities.services.news_data_transformer"
+    )
+    if transformer is not None:
+        transformer._security_pk_for_symbol.cache_clear()
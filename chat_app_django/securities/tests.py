@@ -3,7 +3,9 @@ from django.contrib.auth.models import User
 from decimal import Decimal
 from datetime import date
 
-from .models import Security, SecurityFundamentals, Holding
+from rest_framework.test import APIClient
+
+from .models import Security, SecurityFundamentals, Holding, WatchlistItem
 from .services.portfolio_service import PortfolioService, PortfolioData, PortfolioSummary, HoldingWithComposition
 
 
@@ -253,3 +255,207 @@ class PortfolioServiceTestCase(TestCase):
         portfolio2 = PortfolioService.calculate_portfolio_composition(user2)
         self.assertEqual(len(portfolio2.holdings), 1)
         self.assertEqual(portfolio2.holdings[0].holding.security.symbol, 'MSFT')
+
+class WatchlistAddEndpointTestCase(TestCase):
+    """Test cases for the watchlist add endpoints (single, batch, bulk)"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.security1 = Security.objects.create(
+            symbol='AAPL',
+            name='Apple Inc.',
+            security_type='CS',
+            exchange='NASDAQ'
+        )
+        self.security2 = Security.objects.create(
+            symbol='MSFT',
+            name='Microsoft Corporation',
+            security_type='CS',
+            exchange='NASDAQ'
+        )
+
+    def test_single_item_post(self):
+        """Test adding one item with a dict body"""
+        response = self.client.post(
+            '/api/watchlist/', {'security_symbol': 'aapl'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            WatchlistItem.objects.filter(
+                user=self.user, security=self.security1
+            ).count(),
+            1,
+        )
+
+    def test_list_body_post(self):
+        """Test batch-adding several items with a list body"""
+        response = self.client.post(
+            '/api/watchlist/',
+            [
+                {'security_symbol': 'AAPL'},
+                {'security_symbol': 'msft'},
+                {'security_symbol': 'ZZZZ'},
+            ],
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['added'], ['AAPL', 'MSFT'])
+        self.assertEqual(response.data['not_found'], ['ZZZZ'])
+        self.assertEqual(
+            WatchlistItem.objects.filter(user=self.user).count(), 2
+        )
+
+    def test_list_body_post_with_duplicates(self):
+        """Test that already-watchlisted symbols are reported, not re-added"""
+        WatchlistItem.objects.create(user=self.user, security=self.security1)
+
+        response = self.client.post(
+            '/api/watchlist/',
+            [{'security_symbol': 'AAPL'}, {'security_symbol': 'MSFT'}],
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['added'], ['MSFT'])
+        self.assertEqual(response.data['already_in_watchlist'], ['AAPL'])
+
+    def test_malformed_list_body_post(self):
+        """Test that a list with non-dict entries returns 400"""
+        response = self.client.post(
+            '/api/watchlist/',
+            [{'security_symbol': 'AAPL'}, 'junk'],
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(WatchlistItem.objects.count(), 0)
+
+    def test_bulk_add_endpoint(self):
+        """Test the dedicated bulk-add endpoint"""
+        response = self.client.post(
+            '/api/watchlist/bulk-add/',
+            {'symbols': ['AAPL', 'MSFT', 'ZZZZ']},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['added'], ['AAPL', 'MSFT'])
+        self.assertEqual(response.data['not_found'], ['ZZZZ'])
+
+    def test_bulk_add_rejects_list_body(self):
+        """Test that a bare JSON list to bulk-add returns 400, not 500"""
+        response = self.client.post(
+            '/api/watchlist/bulk-add/', ['AAPL', 'MSFT'], format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_unauthenticated_post(self):
+        """Test that anonymous requests are rejected"""
+        response = APIClient().post(
+            '/api/watchlist/', {'security_symbol': 'AAPL'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+
+class SecurityListEndpointTestCase(TestCase):
+    """Test cases for the security list endpoint's pagination and caching"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        for symbol in ('AAA', 'BBB', 'CCC', 'DDD'):
+            security = Security.objects.create(
+                symbol=symbol,
+                name=f'{symbol} Corp.',
+                security_type='CS',
+                exchange='NYSE'
+            )
+            SecurityFundamentals.objects.create(
+                security=security,
+                current_price=Decimal('100.00')
+            )
+
+    def test_offset_pagination(self):
+        """Test count, next_offset and next_cursor on a sliced page"""
+        response = self.client.get('/api/securities/', {'limit': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual(response.data['next_offset'], 2)
+        self.assertEqual(response.data['next_cursor'], 'BBB')
+        self.assertEqual(
+            [row['symbol'] for row in response.data['results']],
+            ['AAA', 'BBB'],
+        )
+
+    def test_keyset_pagination(self):
+        """Test that after=<symbol> resumes past the cursor"""
+        response = self.client.get(
+            '/api/securities/', {'limit': 2, 'after': 'BBB'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row['symbol'] for row in response.data['results']],
+            ['CCC', 'DDD'],
+        )
+
+    def test_last_page_has_no_next(self):
+        """Test that the final page reports no continuation"""
+        response = self.client.get(
+            '/api/securities/', {'limit': 2, 'offset': 2}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['next_offset'])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_search_ranks_exact_match_first(self):
+        """Test that an exact symbol hit outranks fuzzy matches"""
+        Security.objects.create(
+            symbol='AA',
+            name='AAA lookalike',
+            security_type='CS',
+            exchange='NYSE'
+        )
+
+        response = self.client.get('/api/securities/', {'search': 'AA'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['symbol'], 'AA')
+
+    def test_conditional_get_returns_304(self):
+        """Test that a matching ETag revalidates without a body"""
+        first = self.client.get('/api/securities/')
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        self.assertTrue(etag)
+
+        revalidated = self.client.get(
+            '/api/securities/', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(revalidated.status_code, 304)
+
+        stale = self.client.get(
+            '/api/securities/', HTTP_IF_NONE_MATCH='W/"123"'
+        )
+        self.assertEqual(stale.status_code, 200)
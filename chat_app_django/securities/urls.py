@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import SecurityListView, SecurityDetailView, WatchlistItemListView, WatchlistItemDetailView, HoldingsListView
+from .views import SecurityListView, SecurityDetailView, WatchlistItemListView, WatchlistBulkAddView, WatchlistItemDetailView, HoldingsListView
 
 app_name = "securities"
 
@@ -10,6 +10,7 @@ urlpatterns = [
     
     # Watchlist endpoints
     path("watchlist/", WatchlistItemListView.as_view(), name="watchlist-list"),
+    path("watchlist/bulk-add/", WatchlistBulkAddView.as_view(), name="watchlist-bulk-add"),
     path("watchlist/<int:pk>/", WatchlistItemDetailView.as_view(), name="watchlist-detail"),
     
     # Holdings endpoints
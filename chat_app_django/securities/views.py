@@ -1,11 +1,32 @@
+from urllib.parse import urlencode
+
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q, Case, When, Value, IntegerField
-from .models import Security, WatchlistItem, Holding
-from .serializers import SecurityListSerializer, SecurityDetailSerializer, WatchlistItemSerializer, HoldingWithCompositionSerializer
+from django.db.models import (
+    Q, Case, ExpressionWrapper, F, FloatField, Prefetch, When, Value,
+)
+from django.db.models import Max
+from django.db.models.functions import Round
+from django.http import HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+from .models import NewsItem, Security, WatchlistItem, Holding
+from .serializers import SecurityDetailSerializer, WatchlistItemSerializer, HoldingWithCompositionSerializer
 from .services.portfolio_service import PortfolioService
+from .signals import (
+    bump_watchlist_version,
+    get_securities_version,
+    get_watchlist_version,
+)
+
+# Orderings the list endpoint accepts; built once instead of a fresh
+# list (and O(n) scan) per request on a high-traffic endpoint
+_VALID_ORDERINGS = frozenset({
+    'symbol', '-symbol', 'name', '-name', 'security_type', '-security_type',
+})
 
 
 class SecurityListView(APIView):
@@ -13,10 +34,80 @@ class SecurityListView(APIView):
     List all securities with optional filtering and search.
     GET /api/securities/
     """
-    
+
+    # Upper bound on staleness for writes that bypass signals
+    # (bulk_create/update in the fundamentals commands)
+    CACHE_TTL = 300
+
+    # Page bounds so one request can't materialize the whole security
+    # universe into serializer output
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 500
+
+    @staticmethod
+    def _etag(last_modified):
+        """Weak ETag derived from the freshness timestamp."""
+        if last_modified is None:
+            return None
+        return 'W/"{}"'.format(int(last_modified.timestamp()))
+
+    @staticmethod
+    def _not_modified(request, last_modified):
+        """True when the client's cache validators cover last_modified."""
+        if last_modified is None:
+            return False
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110);
+        # some proxies strip or rewrite date headers but pass ETags through
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            client_tags = {tag.strip() for tag in if_none_match.split(',')}
+            return (
+                '*' in client_tags
+                or SecurityListView._etag(last_modified) in client_tags
+            )
+        if_modified_since = parse_http_date_safe(
+            request.META.get('HTTP_IF_MODIFIED_SINCE', '')
+        )
+        return (
+            if_modified_since is not None
+            and if_modified_since >= int(last_modified.timestamp())
+        )
+
+    @staticmethod
+    def _set_validators(response, last_modified):
+        """Attach Last-Modified and ETag headers for conditional requests."""
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+            response['ETag'] = SecurityListView._etag(last_modified)
+        return response
+
     def get(self, request):
         """Get list of all securities with optional filtering"""
-        securities = Security.objects.filter(is_active=True).select_related('fundamentals')
+        # Polling clients get a 304 and skip all query/serialization work
+        # when nothing has changed since their last fetch. Both tables
+        # feed the validator: fundamentals refreshes move last_updated,
+        # while new listings, deactivations and logo changes only touch
+        # the Security row.
+        latest = Security.objects.aggregate(
+            security=Max('updated_at'),
+            fundamentals=Max('fundamentals__last_updated'),
+        )
+        timestamps = [ts for ts in latest.values() if ts is not None]
+        last_modified = max(timestamps) if timestamps else None
+        if self._not_modified(request, last_modified):
+            return HttpResponseNotModified()
+
+        # Serialized responses barely change between fundamentals refreshes;
+        # cache them keyed by query params plus a version counter that
+        # signals bump on every Security/SecurityFundamentals write
+        cache_key = "securities:list:v{}:{}".format(
+            get_securities_version(),
+            urlencode(sorted(request.query_params.items())),
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return self._set_validators(Response(cached), last_modified)
+        securities = Security.objects.filter(is_active=True)
         
         # Optional filtering by security type
         security_type = request.query_params.get('type', None)
@@ -28,61 +119,135 @@ class SecurityListView(APIView):
         if exchange:
             securities = securities.filter(exchange__iexact=exchange)
         
-        # Optional search by symbol or name
+        # Optional search by symbol or name; applied below as two indexed
+        # arms (exact symbol matches first, then fuzzy matches) rather
+        # than a per-row search_priority annotation
         search = request.query_params.get('search', None)
-        if search:
-            securities = securities.filter(
-                Q(symbol__icontains=search) | Q(name__icontains=search)
-            ).annotate(
-                # Priority: exact symbol match = 1, other matches = 2
-                search_priority=Case(
-                    When(symbol__iexact=search, then=Value(1)),
-                    default=Value(2),
-                    output_field=IntegerField()
-                )
-            )
-        
+
         # Optional ordering
         ordering = request.query_params.get('ordering', 'symbol')
-        valid_orderings = ['symbol', '-symbol', 'name', '-name', 'security_type', '-security_type']
-        
-        if search:
-            # When searching, prioritize exact symbol matches first, then apply user ordering
-            if ordering in valid_orderings:
-                securities = securities.order_by('search_priority', ordering)
-            else:
-                securities = securities.order_by('search_priority', 'symbol')
-        else:
-            # No search, use normal ordering
-            if ordering in valid_orderings:
-                securities = securities.order_by(ordering)
-            else:
-                securities = securities.order_by('symbol')
+        order = ordering if ordering in _VALID_ORDERINGS else 'symbol'
+        if not search:
+            securities = securities.order_by(order)
         
-        # Optional pagination (basic limit/offset)
+        # Pagination (basic limit/offset, bounded)
         limit = request.query_params.get('limit', None)
         offset = request.query_params.get('offset', 0)
-        
+
         try:
             offset = int(offset)
         except (ValueError, TypeError):
             offset = 0
-            
-        if limit:
-            try:
-                limit = int(limit)
-                securities = securities[offset:offset + limit]
-            except (ValueError, TypeError):
-                securities = securities[offset:]
+
+        try:
+            limit = int(limit)
+        except (ValueError, TypeError):
+            limit = self.DEFAULT_LIMIT
+        if limit <= 0:
+            limit = self.DEFAULT_LIMIT
+        limit = min(limit, self.MAX_LIMIT)
+
+        # Keyset pagination: with the default symbol ordering, after=<symbol>
+        # seeks straight to the next page through the symbol index instead
+        # of scanning and discarding `offset` rows. Search results use the
+        # priority ordering, where only offset paging applies.
+        after = request.query_params.get('after', None)
+        symbol_ordered = not search and order == 'symbol'
+        if after and symbol_ordered:
+            securities = securities.filter(symbol__gt=after)
+            offset = 0
+
+        # Build response rows straight from values(): dicts come back from
+        # the driver without Model instances or DRF serializer machinery,
+        # and the SELECT only carries the rendered columns (no
+        # news_summary TextField). day_change_percent is computed in SQL
+        # to match the SecurityFundamentals model property.
+        day_change_percent = Case(
+            When(
+                Q(fundamentals__current_price__isnull=False)
+                & Q(fundamentals__previous_close__isnull=False)
+                & ~Q(fundamentals__previous_close=0),
+                then=Round(
+                    ExpressionWrapper(
+                        (
+                            F('fundamentals__current_price')
+                            - F('fundamentals__previous_close')
+                        )
+                        * Value(100.0)
+                        / F('fundamentals__previous_close'),
+                        output_field=FloatField(),
+                    ),
+                    2,
+                ),
+            ),
+            default=None,
+            output_field=FloatField(),
+        )
+        def shape(qs):
+            return qs.values(
+                'symbol', 'name', 'security_type', 'exchange', 'logo_url',
+                'is_active',
+                current_price=F('fundamentals__current_price'),
+                previous_close=F('fundamentals__previous_close'),
+                day_change=F('fundamentals__day_change'),
+                day_change_percent=day_change_percent,
+                market_cap=F('fundamentals__market_cap'),
+                pe_ratio=F('fundamentals__pe_ratio'),
+                eps=F('fundamentals__eps'),
+                dividend_yield=F('fundamentals__dividend_yield'),
+                volume=F('fundamentals__volume'),
+                avg_volume=F('fundamentals__avg_volume'),
+                year_high=F('fundamentals__year_high'),
+                year_low=F('fundamentals__year_low'),
+                book_value=F('fundamentals__book_value'),
+                debt_to_equity=F('fundamentals__debt_to_equity'),
+                roe=F('fundamentals__roe'),
+            )
+
+        if search:
+            # Exact symbol matches come back first. Two ordered queries
+            # replace the old search_priority Case/When: the exact arm
+            # resolves through the symbol index, and the fuzzy arm no
+            # longer computes a priority column for every match.
+            exact_qs = securities.filter(symbol__iexact=search).order_by(order)
+            fuzzy_qs = securities.filter(
+                Q(symbol__icontains=search) | Q(name__icontains=search)
+            ).exclude(symbol__iexact=search).order_by(order)
+
+            exact_count = exact_qs.count()
+            total = exact_count + fuzzy_qs.count()
+
+            results = list(shape(exact_qs)[offset:offset + limit])
+            if len(results) < limit:
+                # Page windows can straddle the two arms; the fuzzy arm
+                # picks up where the exact arm's rows left off
+                fuzzy_offset = max(0, offset - exact_count)
+                results += list(
+                    shape(fuzzy_qs)[
+                        fuzzy_offset:fuzzy_offset + limit - len(results)
+                    ]
+                )
         else:
-            securities = securities[offset:]
-        
-        serializer = SecurityListSerializer(securities, many=True)
-        
-        return Response({
-            'count': len(serializer.data),
-            'results': serializer.data
-        })
+            # Total matches before slicing, so clients can page; the
+            # sliced queryset only serializes the requested window
+            total = securities.count()
+            results = list(shape(securities)[offset:offset + limit])
+
+        next_offset = offset + limit if offset + limit < total else None
+        payload = {
+            'count': total,
+            'next_offset': next_offset,
+            # Cursor for keyset paging (pass back as ?after=...); only
+            # meaningful under the default symbol ordering
+            'next_cursor': (
+                results[-1]['symbol']
+                if symbol_ordered and next_offset is not None
+                else None
+            ),
+            'results': results
+        }
+        cache.set(cache_key, payload, self.CACHE_TTL)
+        return self._set_validators(Response(payload), last_modified)
 
 
 class SecurityDetailView(APIView):
@@ -94,16 +259,73 @@ class SecurityDetailView(APIView):
     def get_object(self, symbol):
         """Get security object by symbol or return 404"""
         return get_object_or_404(
-            Security.objects.select_related('fundamentals'), 
-            symbol__iexact=symbol, 
+            Security.objects.with_fundamentals(),
+            # Symbols are stored canonically upper-cased (Security.save),
+            # so an exact match on the upcased input seeks the symbol
+            # btree directly instead of an iexact expression match
+            symbol=symbol.upper(),
             is_active=True
         )
     
     def get(self, request, symbol):
         """Get detailed security information"""
         security = self.get_object(symbol)
+
+        # Key freshness on whichever of the security row / fundamentals
+        # row changed most recently
+        fundamentals = getattr(security, 'fundamentals', None)
+        timestamps = [security.updated_at]
+        if fundamentals:
+            timestamps.append(fundamentals.last_updated)
+        last_modified = max(timestamps)
+        if SecurityListView._not_modified(request, last_modified):
+            return HttpResponseNotModified()
+
         serializer = SecurityDetailSerializer(security)
-        return Response(serializer.data)
+        return SecurityListView._set_validators(
+            Response(serializer.data), last_modified
+        )
+
+
+def _bulk_add_to_watchlist(user, requested):
+    """
+    Add a set of upper-cased symbols to a user's watchlist in three
+    queries: one for the securities, one for the rows already present,
+    one multi-row INSERT for the difference.
+
+    Returns (summary dict, whether anything was created).
+    """
+    securities = {
+        security.symbol: security
+        for security in Security.objects.filter(
+            symbol__in=requested, is_active=True
+        )
+    }
+    existing_ids = set(
+        WatchlistItem.objects.filter(
+            user=user,
+            security_id__in=[s.id for s in securities.values()],
+        ).values_list('security_id', flat=True)
+    )
+
+    to_create = [
+        WatchlistItem(user=user, security=security)
+        for security in securities.values()
+        if security.id not in existing_ids
+    ]
+    WatchlistItem.objects.bulk_create(to_create, ignore_conflicts=True)
+    if to_create:
+        # bulk_create skips post_save, so invalidate the cached feed here
+        bump_watchlist_version(user.id)
+
+    return {
+        'added': sorted(item.security.symbol for item in to_create),
+        'already_in_watchlist': sorted(
+            symbol for symbol, security in securities.items()
+            if security.id in existing_ids
+        ),
+        'not_found': sorted(requested - securities.keys()),
+    }, bool(to_create)
 
 
 class WatchlistItemListView(APIView):
@@ -112,42 +334,92 @@ class WatchlistItemListView(APIView):
     GET /api/watchlist/ - List all watchlist items for authenticated user
     POST /api/watchlist/ - Add a new item to watchlist
     """
-    
+
+    permission_classes = [IsAuthenticated]
+
+    # Bounds staleness from writes the version counters don't see
+    # (news/summary refreshes land via bulk_create)
+    CACHE_TTL = 300
+
     def get(self, request):
         """Get all watchlist items for the authenticated user"""
-        if not request.user.is_authenticated:
-            return Response(
-                {"error": "Authentication required"}, 
-                status=status.HTTP_401_UNAUTHORIZED
-            )
-        
+        # Watchlists change rarely but are fetched on every app open, so
+        # cache the serialized payload per user. The per-user counter
+        # bumps on watchlist adds/removes; the securities counter bumps
+        # on Security/Fundamentals writes, covering price refreshes.
+        cache_key = "watchlist:{}:v{}:s{}".format(
+            request.user.id,
+            get_watchlist_version(request.user.id),
+            get_securities_version(),
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
         watchlist_items = WatchlistItem.objects.filter(
             user=request.user
         ).select_related(
-            'security', 
+            'security',
             'security__fundamentals',
             'security__news_summary',
             'security__news_summary__overall_sentiment'
+        ).defer(
+            # The serializer renders the numeric fundamentals but never
+            # this wide TextField (it's detail-endpoint data)
+            'security__fundamentals__news_summary'
         ).prefetch_related(
-            'security__news_items',
+            # Fetch only the 3 news items the serializer renders per
+            # security instead of prefetching every news row
+            Prefetch(
+                'security__news_items',
+                queryset=NewsItem.objects.all()[:3],
+                to_attr='latest_news_prefetched',
+            ),
             'security__upcoming_events',
             'security__news_summary__key_highlights'
         ).order_by('-added_at')
-        
-        serializer = WatchlistItemSerializer(watchlist_items, many=True)
-        return Response({
-            'count': len(serializer.data),
+
+        # Evaluate once; count from the materialized list instead of
+        # touching serializer.data twice
+        items = list(watchlist_items)
+        serializer = WatchlistItemSerializer(items, many=True)
+        payload = {
+            'count': len(items),
             'results': serializer.data
-        })
+        }
+        cache.set(cache_key, payload, self.CACHE_TTL)
+        return Response(payload)
     
     def post(self, request):
-        """Add a new item to user's watchlist"""
-        if not request.user.is_authenticated:
+        """Add one item (dict body) or several (list body) to the watchlist"""
+
+        if isinstance(request.data, list):
+            # Batch add: one request amortizes auth and validation over
+            # the whole list and the inserts collapse to one statement
+            symbols = [
+                item.get('security_symbol')
+                for item in request.data
+                if isinstance(item, dict)
+            ]
+            if (
+                not symbols
+                or len(symbols) != len(request.data)
+                or not all(isinstance(s, str) and s.strip() for s in symbols)
+            ):
+                return Response(
+                    {"security_symbol": "Each item must provide a security_symbol."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            summary, created_any = _bulk_add_to_watchlist(
+                request.user, {s.strip().upper() for s in symbols}
+            )
             return Response(
-                {"error": "Authentication required"}, 
-                status=status.HTTP_401_UNAUTHORIZED
+                summary,
+                status=status.HTTP_201_CREATED if created_any
+                else status.HTTP_200_OK
             )
-        
+
         serializer = WatchlistItemSerializer(
             data=request.data,
             context={'request': request}
@@ -160,11 +432,47 @@ class WatchlistItemListView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class WatchlistBulkAddView(APIView):
+    """
+    Add several securities to the user's watchlist at once.
+    POST /api/watchlist/bulk-add/ - Body: {"symbols": ["AAPL", "MSFT", ...]}
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """Add a list of symbols to the user's watchlist in three queries"""
+
+        # A bare JSON list body has no .get(); reject it cleanly rather
+        # than 500 (POST /api/watchlist/ is the endpoint that takes one)
+        symbols = (
+            request.data.get('symbols')
+            if isinstance(request.data, dict)
+            else None
+        )
+        if not isinstance(symbols, list) or not symbols:
+            return Response(
+                {"symbols": "Provide a non-empty list of symbols."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        summary, created_any = _bulk_add_to_watchlist(
+            request.user, {str(s).upper() for s in symbols}
+        )
+        return Response(
+            summary,
+            status=status.HTTP_201_CREATED if created_any
+            else status.HTTP_200_OK
+        )
+
+
 class WatchlistItemDetailView(APIView):
     """
     Delete a specific watchlist item.
     DELETE /api/watchlist/{id}/ - Remove item from watchlist
     """
+
+    permission_classes = [IsAuthenticated]
     
     def get_object(self, pk, user):
         """Get watchlist item by ID for the authenticated user"""
@@ -175,7 +483,11 @@ class WatchlistItemDetailView(APIView):
                 'security__news_summary',
                 'security__news_summary__overall_sentiment'
             ).prefetch_related(
-                'security__news_items',
+                Prefetch(
+                    'security__news_items',
+                    queryset=NewsItem.objects.all()[:3],
+                    to_attr='latest_news_prefetched',
+                ),
                 'security__upcoming_events',
                 'security__news_summary__key_highlights'
             ),
@@ -185,11 +497,6 @@ class WatchlistItemDetailView(APIView):
     
     def delete(self, request, pk):
         """Remove item from user's watchlist"""
-        if not request.user.is_authenticated:
-            return Response(
-                {"error": "Authentication required"}, 
-                status=status.HTTP_401_UNAUTHORIZED
-            )
         
         watchlist_item = self.get_object(pk, request.user)
         watchlist_item.delete()
@@ -205,14 +512,11 @@ class HoldingsListView(APIView):
     List user's holdings with portfolio composition.
     GET /api/holdings/ - List all holdings for authenticated user with portfolio percentages
     """
+
+    permission_classes = [IsAuthenticated]
     
     def get(self, request):
         """Get all holdings for the authenticated user with portfolio composition"""
-        if not request.user.is_authenticated:
-            return Response(
-                {"error": "Authentication required"}, 
-                status=status.HTTP_401_UNAUTHORIZED
-            )
         
         # Get portfolio data from service
         portfolio_data = PortfolioService.calculate_portfolio_composition(request.user)